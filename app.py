@@ -3,6 +3,7 @@ from jinja2 import Environment
 from datetime import datetime
 from threading import Timer
 import logging
+import multiprocessing
 import os
 import webbrowser
 
@@ -33,7 +34,7 @@ def create_app():
     # Register routes
     with app.app_context():
         # Import models first to avoid circular dependencies
-        from models import Job
+        from models import Job, upgrade_schema
         
         # Register routes after models
         from routes import register_routes
@@ -41,10 +42,25 @@ def create_app():
         
         # Create database tables
         db.create_all()
+        upgrade_schema()
+
+        # Full-text index for title/description search
+        from services.search import ensure_search_index
+        ensure_search_index()
+
+    # `flask reparse`: re-run parsers over archived responses
+    from services.reparse import register_commands
+    register_commands(app)
+
+    # Background fetch runs (on demand, or every FETCH_INTERVAL_MINUTES when set)
+    from services.scheduler import init_scheduler
+    init_scheduler(app)
 
     return app
 
 if __name__ == '__main__':
+    # Parse workers are spawned processes, needed when running as a frozen executable
+    multiprocessing.freeze_support()
     app = create_app()
     Timer(1, lambda: webbrowser.open('http://127.0.0.1:5000')).start()
     app.run(debug=False)  # Change debug to False for production
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Compares the previous per-site extraction of script-embedded JSON with fetchers.embedded_json.
+
+Usage: python benchmarks/bench_embedded_json.py [--jobs 100 1000 5000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from fetchers.embedded_json import js_assignment, json_property, next_data, quoted_json
+
+# Markup around the payload, so the old code pays for the rest of the document like on real pages
+PAGE_MARKUP = '<div class="section"><p>Careers at a systematic trading firm.</p></div>\n' * 500
+
+
+def make_jobs(count: int):
+    return [{
+        'id': i,
+        'title': f'Quantitative Researcher {i}',
+        'description': '<p>Design and research {systematic} trading strategies.</p>' * 10,
+        'location': 'London',
+    } for i in range(count)]
+
+
+def page(script: str) -> str:
+    return f'<html><head></head><body>{PAGE_MARKUP}<script>{script}</script>{PAGE_MARKUP}</body></html>'
+
+
+def build_pages(jobs):
+    payload = json.dumps(jobs)
+    js_string = payload.replace('\\', '\\\\').replace("'", "\\'")
+    return {
+        'next_data': f'<html><body>{PAGE_MARKUP}<script id="__NEXT_DATA__" type="application/json">'
+                     f'{{"props": {{"pageProps": {{"data": {payload}}}}}}}</script></body></html>',
+        'js_assignment': page(f'window.__appData = {{"jobBoard": {{"jobPostings": {payload}}}}};'),
+        'json_property': page(f'var search = {{"eagerLoadRefineSearch": {{"data": {{"jobs": {payload}}}}}}};'),
+        'quoted_json': page(f"CSSearchModule.init('{js_string}', {{}});"),
+    }
+
+
+# Previous implementations, as they were in the fetchers
+
+def old_next_data(html: str):
+    """APCapitalFetcher/DRWFetcher: full BeautifulSoup parse to find the script tag."""
+    soup = BeautifulSoup(html, 'html.parser')
+    return json.loads(soup.find('script', id='__NEXT_DATA__').string)
+
+
+def old_js_assignment(html: str):
+    """ScientechResearchCapitalFetcher: lazy regex up to the first '};'."""
+    return json.loads(re.search(r'window\.__appData\s*=\s*({.*?});', html, re.DOTALL).group(1))
+
+
+def old_json_property(html: str):
+    """SusquehannaInvestmentFetcher: brace balancing one character at a time."""
+    match = re.search(r'"eagerLoadRefineSearch"\s*:\s*({)', html)
+    brace_count = 1
+    end_index = match.start(1) + 1
+    while brace_count > 0 and end_index < len(html):
+        if html[end_index] == '{': brace_count += 1
+        if html[end_index] == '}': brace_count -= 1
+        end_index += 1
+    return json.loads(html[match.start(1):end_index])
+
+
+def old_quoted_json(html: str):
+    """Point72Fetcher: BeautifulSoup script lookup, quote slicing and replace-based unescaping."""
+    soup = BeautifulSoup(html, 'html.parser')
+    script = soup.find('script', string=lambda t: 'CSSearchModule.init' in (t or ''))
+    text = script.text
+    first = text.find("'")
+    raw = text[first + 1:text.find("',", first + 1)]
+    cleaned = raw.replace('\\\\', '__BACKSLASH__')
+    cleaned = cleaned.replace('\\"', '"')
+    cleaned = cleaned.replace('__BACKSLASH__', '\\')
+    cleaned = cleaned.replace("\\'", "'")
+    return json.loads(cleaned)
+
+
+CASES = [
+    ('next_data', old_next_data, next_data),
+    ('js_assignment', old_js_assignment, lambda html: js_assignment(html, 'window.__appData')),
+    ('json_property', old_json_property, lambda html: json_property(html, 'eagerLoadRefineSearch')),
+    ('quoted_json', old_quoted_json, lambda html: quoted_json(html, 'CSSearchModule.init(')),
+]
+
+
+def timed(fn, html: str, repeat: int) -> float:
+    """Best of repeat runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':>14} {'jobs':>6} {'page KB':>8} {'old':>10} {'new':>10} {'speedup':>8}")
+    for count in args.jobs:
+        pages = build_pages(make_jobs(count))
+        for name, old, new in CASES:
+            html = pages[name]
+            if new(html) != old(html):
+                print(f"{name:>14} {count:>6}  results differ, skipped")
+                continue
+            old_time = timed(old, html, args.repeat)
+            new_time = timed(new, html, args.repeat)
+            print(f"{name:>14} {count:>6} {len(html) // 1024:>8} {old_time * 1000:>8.1f}ms "
+                  f"{new_time * 1000:>8.1f}ms {old_time / new_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Compares parse times and parsed jobs of every fetcher across the installed HTML parser backends, replaying recorded pages.
+
+Each fetcher is run against the response archive (see `flask reparse`), so the timings cover
+parsing plus reading archived bodies, which is the same for every backend. Fetchers without
+archived responses are reported as skipped; run a normal fetch first to record them.
+lxml and selectolax repair malformed markup differently from html.parser: every backend's jobs
+are compared with the html.parser/bs4 baseline, mismatches are listed and make the script exit 1.
+
+Usage: python benchmarks/bench_parsers.py [--archive response_archive] [--site Optiver ...] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetchers.archive import ResponseArchive
+from fetchers.html_parser import available_css_backends, available_parsers, configure_parser
+from fetchers.http_session import enable_replay
+from fetchers.registry import get_registry
+
+
+def backends():
+    """(HTML parser, CSS backend) pairs, the html.parser baseline first."""
+    combos = [('html.parser', 'bs4')]
+    for parser in available_parsers():
+        for css_backend in available_css_backends():
+            if (parser, css_backend) not in combos:
+                combos.append((parser, css_backend))
+    return combos
+
+
+def run(fetcher_class, repeat: int):
+    """Best time of repeat replays and the jobs parsed."""
+    best = float('inf')
+    jobs = []
+    for _ in range(repeat):
+        fetcher = fetcher_class()
+        start = time.perf_counter()
+        jobs = fetcher.fetch_jobs()
+        best = min(best, time.perf_counter() - start)
+    return best, jobs
+
+
+# Fields stored jobs are diffed on (FetcherManager.COMPARED_FIELDS) plus the ATS id; others such
+# as posted_date may default to the time of parsing and differ between any two replays
+COMPARED_FIELDS = ('job_id', 'title', 'description', 'url', 'location')
+
+
+def job_differences(baseline, jobs):
+    """Jobs (as JSON of COMPARED_FIELDS) only in the baseline and only in jobs, ignoring order."""
+    def as_json(job_list):
+        return {json.dumps({field: job.get(field) for field in COMPARED_FIELDS}, sort_keys=True, default=str)
+                for job in job_list}
+
+    expected, actual = as_json(baseline), as_json(jobs)
+    return sorted(expected - actual), sorted(actual - expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--archive', default='response_archive')
+    parser.add_argument('--site', dest='sites', action='append', default=[])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.archive):
+        sys.exit(f"No response archive found at {args.archive!r}")
+
+    specs = [spec for spec in get_registry().enabled() if not args.sites or spec.site_name in args.sites]
+    enable_replay(ResponseArchive(args.archive))
+
+    combos = backends()
+    header = ''.join(f"{f'{p}/{c}':>22}" for p, c in combos)
+    print(f"{'site':<32}{'jobs':>6}{header}")
+    totals = [0.0] * len(combos)
+    mismatches = []
+    for spec in specs:
+        site_name = spec.site_name
+        timings = []
+        results = []
+        try:
+            fetcher_class = spec.load()
+            for html_parser, css_backend in combos:
+                configure_parser(html_parser, css_backend)
+                elapsed, jobs = run(fetcher_class, args.repeat)
+                timings.append(elapsed)
+                results.append(jobs)
+        except Exception as e:
+            print(f"{site_name:<32}  skipped: {str(e)[:80]}")
+            continue
+
+        for i, elapsed in enumerate(timings):
+            totals[i] += elapsed
+        for (html_parser, css_backend), jobs in zip(combos[1:], results[1:]):
+            missing, extra = job_differences(results[0], jobs)
+            if missing or extra:
+                mismatches.append((site_name, f"{html_parser}/{css_backend}", missing, extra))
+        job_counts = '/'.join(str(count) for count in sorted({len(jobs) for jobs in results}))
+        cells = ''.join(f"{elapsed * 1000:>20.1f}ms" for elapsed in timings)
+        print(f"{site_name:<32}{job_counts:>6}{cells}")
+
+    cells = ''.join(f"{elapsed * 1000:>20.1f}ms" for elapsed in totals)
+    print(f"{'total':<32}{'':>6}{cells}")
+    if totals[0]:
+        print('speedup vs html.parser: ' + ', '.join(
+            f"{p}/{c} {totals[0] / total:.1f}x" for (p, c), total in zip(combos, totals) if total))
+
+    if not mismatches:
+        print('\nAll backends parsed the same jobs as html.parser/bs4')
+        return
+    print(f"\n{len(mismatches)} site/backend pairs parsed different jobs than html.parser/bs4:")
+    for site_name, backend, missing, extra in mismatches:
+        print(f"{site_name} with {backend}: {len(missing)} missing, {len(extra)} different or extra")
+        for job in missing[:3]:
+            print(f"  - {job[:200]}")
+        for job in extra[:3]:
+            print(f"  + {job[:200]}")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,3 @@
-import requests
 import logging
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
@@ -14,8 +13,9 @@ class AkunaCapitalFetcher(BaseFetcher):
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
+            self._check_listing(response.text)
             data = response.json()
 
             return [
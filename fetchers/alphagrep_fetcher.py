@@ -1,6 +1,4 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
 
@@ -17,7 +15,8 @@ class AlphagrepFetcher(BaseFetcher):
         jobs = []
         try:
             html = self._get_html()
-            soup = BeautifulSoup(html, 'html.parser')
+            self._check_listing(html)
+            soup = self._soup(html)
             
             job_list = soup.find('ul', class_='result-list')
             if not job_list:
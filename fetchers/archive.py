@@ -0,0 +1,301 @@
+import hashlib
+import http.client
+import json
+import logging
+import mmap
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from requests.cookies import extract_cookies_to_jar
+
+logger = logging.getLogger(__name__)
+
+# Transfer-level headers that no longer describe the stored (decoded) body; Set-Cookie is
+# kept apart as a list (set_cookies), a header dict would merge repeated cookies
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+# Cookie lifetime attributes, dropped on replay so archived cookies apply however old they are
+EXPIRY_ATTRIBUTES = re.compile(r';\s*(?:expires|max-age)=[^;]*', re.IGNORECASE)
+
+INDEX_SCHEMA = """CREATE TABLE IF NOT EXISTS responses (
+    request_key TEXT PRIMARY KEY,
+    method TEXT,
+    url TEXT,
+    digest TEXT,
+    status INTEGER,
+    headers TEXT,
+    encoding TEXT,
+    fetched_at TEXT,
+    set_cookies TEXT
+)"""
+
+
+def request_key(method: str, url: str, body: Any = None) -> str:
+    """Identity of a request: method, prepared URL and body (POST payloads select different pages)."""
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha256()
+    digest.update(f"{method.upper()} {url}\n".encode())
+    digest.update(body or b'')
+    return digest.hexdigest()
+
+
+def prepared_url(url: str) -> str:
+    """Normalizes a URL the way requests does before sending it, so both HTTP clients share keys."""
+    return requests.Request('GET', url).prepare().url
+
+
+class ResponseArchive:
+    """
+    Content-addressed archive of raw HTTP responses.
+    Bodies are zlib-compressed under objects/<2 hex>/<sha256>, so identical responses
+    are stored once; index.db maps each request to the latest body fetched for it.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(os.path.join(root, 'index.db'), check_same_thread=False)
+        with self._lock, self._index:
+            self._index.execute(INDEX_SCHEMA)
+            columns = {row[1] for row in self._index.execute("PRAGMA table_info(responses)")}
+            if 'set_cookies' not in columns:
+                self._index.execute("ALTER TABLE responses ADD COLUMN set_cookies TEXT")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def put_body(self, body: bytes) -> str:
+        """Stores a body once and returns its digest."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent writers and readers never see a partial object
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(zlib.compress(body, 6))
+        os.replace(tmp_path, path)
+        return digest
+
+    def read_body(self, digest: str) -> bytes:
+        """Reads a stored body through a memory map instead of copying the compressed file first."""
+        with open(self._object_path(digest), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return zlib.decompress(mapped)
+
+    def record(self, method: str, url: str, request_body: Any, status: int, body: bytes,
+               headers: Dict[str, str], encoding: Optional[str], set_cookies: Optional[List[str]] = None) -> None:
+        """Archives a response; set_cookies are its Set-Cookie header values, replayed into the session's jar."""
+        digest = self.put_body(body)
+        headers = {name: value for name, value in headers.items() if name.lower() not in DROPPED_HEADERS}
+        with self._lock, self._index:
+            self._index.execute(
+                "INSERT OR REPLACE INTO responses (request_key, method, url, digest, status, headers, encoding, "
+                "fetched_at, set_cookies) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (request_key(method, url, request_body), method.upper(), url, digest, status,
+                 json.dumps(headers), encoding, datetime.utcnow().isoformat(), json.dumps(set_cookies or []))
+            )
+
+    def record_response(self, response: requests.Response, *args, **kwargs) -> None:
+        """requests response hook archiving successful responses."""
+        # 304s have no body, the archived one stays current
+        if not 200 <= response.status_code < 300:
+            return
+        request = response.request
+        try:
+            self.record(request.method, request.url, request.body, response.status_code,
+                        response.content, dict(response.headers), response.encoding,
+                        set_cookie_headers(response))
+        except Exception as e:
+            logger.warning(f"Failed to archive response from {request.url}: {str(e)}")
+
+    def touch(self, method: str, url: str, request_body: Any = None) -> None:
+        """Marks an archived response as current again (revalidated with a 304), so prune keeps it."""
+        with self._lock, self._index:
+            self._index.execute("UPDATE responses SET fetched_at = ? WHERE request_key = ?",
+                                (datetime.utcnow().isoformat(), request_key(method, url, request_body)))
+
+    def prune(self, max_age: timedelta, grace_seconds: float = 3600) -> Tuple[int, int]:
+        """
+        Drops index entries not fetched or revalidated within max_age, then deletes the bodies
+        no entry refers to any more (older versions of changed responses). Bodies younger than
+        grace_seconds are kept, they may belong to a record() that has not been indexed yet.
+        Returns (entries removed, bodies removed).
+        """
+        cutoff = (datetime.utcnow() - max_age).isoformat()
+        with self._lock, self._index:
+            entries = self._index.execute("DELETE FROM responses WHERE fetched_at < ?", (cutoff,)).rowcount
+            referenced = {row[0] for row in self._index.execute("SELECT DISTINCT digest FROM responses")}
+
+        bodies = 0
+        now = time.time()
+        for directory, _, file_names in os.walk(self.objects_dir):
+            for file_name in file_names:
+                path = os.path.join(directory, file_name)
+                if file_name in referenced:
+                    continue
+                try:
+                    if now - os.path.getmtime(path) > grace_seconds:
+                        os.remove(path)
+                        bodies += 1
+                except OSError:
+                    continue
+        logger.info(f"Pruned response archive: {entries} stale entries, {bodies} unreferenced bodies")
+        return entries, bodies
+
+    def lookup_meta(self, method: str, url: str, request_body: Any = None) -> Optional[Dict[str, Any]]:
+        """Returns the metadata of the latest archived response to a request without reading its body."""
+        with self._lock:
+            row = self._index.execute(
+                "SELECT digest, status, headers, encoding, fetched_at, set_cookies FROM responses "
+                "WHERE request_key = ?",
+                (request_key(method, url, request_body),)
+            ).fetchone()
+        if row is None:
+            return None
+        digest, status, headers, encoding, fetched_at, set_cookies = row
+        return {'digest': digest, 'status': status, 'headers': json.loads(headers),
+                'encoding': encoding, 'fetched_at': fetched_at,
+                'set_cookies': json.loads(set_cookies) if set_cookies else []}
+
+    def lookup(self, method: str, url: str, request_body: Any = None) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Returns (body, metadata) of the latest archived response to a request, or None."""
+        meta = self.lookup_meta(method, url, request_body)
+        if meta is None:
+            return None
+        return self.read_body(meta['digest']), meta
+
+
+def set_cookie_headers(response: requests.Response) -> List[str]:
+    """Every Set-Cookie header value of a requests response, in order."""
+    raw_headers = getattr(response.raw, 'headers', None)
+    if hasattr(raw_headers, 'getlist'):
+        return raw_headers.getlist('Set-Cookie')
+    value = response.headers.get('Set-Cookie')
+    return [value] if value else []
+
+
+def replay_cookies(jar: requests.cookies.RequestsCookieJar, request: requests.PreparedRequest,
+                   set_cookies: List[str]) -> None:
+    """
+    Loads archived Set-Cookie headers into jar the way requests does for live responses,
+    so flows that depend on cookies (e.g. Workday's CSRF token) replay too.
+    Lifetimes are dropped: the cookies were valid when archived.
+    """
+    if not set_cookies:
+        return
+    headers = http.client.HTTPMessage()
+    for value in set_cookies:
+        headers['Set-Cookie'] = EXPIRY_ATTRIBUTES.sub('', value)
+    extract_cookies_to_jar(jar, request, SimpleNamespace(_original_response=SimpleNamespace(msg=headers)))
+
+
+def conditional_headers(meta: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """If-None-Match/If-Modified-Since headers revalidating an archived response."""
+    if meta is None:
+        return {}
+    stored = requests.structures.CaseInsensitiveDict(meta['headers'])
+    headers = {}
+    if stored.get('ETag'):
+        headers['If-None-Match'] = stored['ETag']
+    if stored.get('Last-Modified'):
+        headers['If-Modified-Since'] = stored['Last-Modified']
+    return headers
+
+
+def archived_response(request: requests.PreparedRequest, body: bytes, meta: Dict[str, Any]) -> requests.Response:
+    """Builds a requests Response carrying an archived body."""
+    response = requests.Response()
+    response.status_code = meta['status']
+    response.reason = 'OK'
+    response.headers = requests.structures.CaseInsensitiveDict(meta['headers'])
+    response.encoding = meta['encoding']
+    response._content = body
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class ConditionalSession(requests.Session):
+    """
+    Session revalidating GET requests against the archive: when an archived response has
+    an ETag or Last-Modified validator, the request carries If-None-Match/If-Modified-Since
+    and a 304 answer is replaced by the archived body, so callers always see a full 200.
+    """
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        archive = get_archive()
+        meta = None
+        if archive is not None and request.method == 'GET':
+            meta = archive.lookup_meta(request.method, request.url)
+            for name, value in conditional_headers(meta).items():
+                request.headers.setdefault(name, value)
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and meta is not None:
+            logger.info(f"Not modified, using archived response for {request.url}")
+            archive.touch(request.method, request.url)
+            cached = archived_response(request, archive.read_body(meta['digest']), meta)
+            cached.history = response.history
+            cached.elapsed = response.elapsed
+            response.close()
+            return cached
+        return response
+
+
+class ReplaySession(requests.Session):
+    """
+    Session answering every request from the archive, without network I/O.
+    Archived Set-Cookie headers are loaded into the session's cookie jar like live ones.
+    Requests missing from the archive are appended to misses before failing, so a caller
+    can tell a complete replay from one a fetcher's error handling turned into partial results.
+    """
+
+    def __init__(self, archive: ResponseArchive, misses: Optional[List[str]] = None):
+        super().__init__()
+        self.archive = archive
+        self.misses = misses if misses is not None else []
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        archived = self.archive.lookup(request.method, request.url, request.body)
+        if archived is None:
+            self.misses.append(f"{request.method} {request.url}")
+            raise requests.ConnectionError(f"No archived response for {request.method} {request.url}",
+                                           request=request)
+        body, meta = archived
+        response = archived_response(request, body, meta)
+        replay_cookies(response.cookies, request, meta['set_cookies'])
+        replay_cookies(self.cookies, request, meta['set_cookies'])
+        return response
+
+
+_archive: Optional[ResponseArchive] = None
+_archive_lock = threading.Lock()
+
+
+def configure_archive(root: Optional[str]) -> Optional[ResponseArchive]:
+    """Enables archiving under root for this process (disabled when root is empty)."""
+    global _archive
+    with _archive_lock:
+        if not root:
+            _archive = None
+        elif _archive is None or os.path.abspath(_archive.root) != os.path.abspath(root):
+            _archive = ResponseArchive(root)
+        return _archive
+
+
+def get_archive() -> Optional[ResponseArchive]:
+    return _archive
@@ -4,6 +4,8 @@ import json
 import re
 
 class AspectCapitalFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="Aspect Capital",
@@ -1,4 +1,3 @@
-import requests
 import logging
 import re
 from typing import List, Dict, Any
@@ -28,13 +27,14 @@ class BalyansyAssetManagementFetcher(BaseFetcher):
                 'aura.token': 'null'
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.url,
                 headers=self.headers,
                 data=data,
                 timeout=self.timeout
             )
             response.raise_for_status()
+            self._check_listing(response.text)
 
             json_data = response.json()
             for action in json_data.get('actions', []):
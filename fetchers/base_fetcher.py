@@ -1,11 +1,102 @@
-import requests
+import asyncio
+import aiohttp
+import hashlib
+import importlib.util
 import logging
-from typing import List, Dict, Any
+import re
+import sys
+from datetime import datetime
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 from requests.exceptions import RequestException
+from bs4 import BeautifulSoup, SoupStrainer
+from .archive import conditional_headers, get_archive, prepared_url
+from .html_parser import CSSNode, css_document, current_css_backend, current_parser, make_soup
+from .politeness import THROTTLE_STATUSES, bind_run_budget, get_politeness
+from .http_session import get_session
 
 logger = logging.getLogger(__name__)
 
+# Fetcher instances of a parse worker process, by class
+_worker_fetchers: Dict[type, 'BaseFetcher'] = {}
+
+# Shared modules whose code shapes parse results besides the fetcher's own classes
+PARSER_HELPER_MODULES = ('fetchers.embedded_json', 'fetchers.html_parser')
+_code_hashes: Dict[type, str] = {}
+
+
+def _code_hash(fetcher_class: type) -> str:
+    """
+    Hash of the source of the modules defining fetcher_class and its fetcher base classes,
+    plus PARSER_HELPER_MODULES, so deploying a parser fix changes it.
+    Sources that cannot be read (e.g. frozen builds) are left out, parser_version still counts.
+    """
+    code_hash = _code_hashes.get(fetcher_class)
+    if code_hash is None:
+        paths = []
+        for cls in fetcher_class.__mro__:
+            if issubclass(cls, BaseFetcher):
+                paths.append(getattr(sys.modules.get(cls.__module__), '__file__', None))
+        for module in PARSER_HELPER_MODULES:
+            spec = importlib.util.find_spec(module)
+            paths.append(spec.origin if spec else None)
+
+        digest = hashlib.sha256()
+        for path in sorted(set(filter(None, paths))):
+            try:
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                continue
+        code_hash = _code_hashes[fetcher_class] = digest.hexdigest()
+    return code_hash
+
+
+def parse_in_worker(fetcher_class: type, method: str, content: Any) -> List[Dict[str, Any]]:
+    """
+    Runs a fetcher's parse method (parse_jobs or parse_page) on downloaded content.
+    Executed in FetcherManager's parse process pool, so only fetchers with parse_in_pool are sent here.
+    """
+    fetcher = _worker_fetchers.get(fetcher_class)
+    if fetcher is None:
+        fetcher = _worker_fetchers[fetcher_class] = fetcher_class()
+    return getattr(fetcher, method)(content)
+
+class ListingUnchanged(BaseException):
+    """
+    Raised by _check_listing when the listing response matches the previous successful run,
+    so the fetch skips parsing and storing. Like asyncio.CancelledError it derives from
+    BaseException, which lets it pass through the fetchers' broad `except Exception` handlers.
+    """
+
 class BaseFetcher:
+    # Set by fetchers that request one detail page per job through _fetch_details,
+    # FetcherManager then provides previously stored jobs in known_jobs
+    fetches_details = False
+    # Set by detail fetchers whose listing changes whenever a detail page does
+    # (e.g. it carries per-job update times), so an unchanged listing can still short-circuit
+    listing_covers_details = False
+    # Set by fetchers whose parse_jobs/parse_page only parse their input (no requests, no
+    # known_jobs), so FetcherManager may run them in its parse process pool
+    parse_in_pool = False
+    # Cleared by fetchers that FetcherRegistry should list but FetcherManager should not run
+    # (read from the class body without importing the module, so it must be a literal)
+    enabled = True
+    # Extra names runs can select the fetcher by, besides its ATS type and cost class
+    # (e.g. ('market-maker',)), also read from the class body as a literal
+    tags = ()
+
+    # Bump when parse results change for reasons the fetcher's source does not show
+    # (listing fingerprints include it, so unchanged listings are parsed again once)
+    parser_version = 1
+
+    # Per-request noise removed from listing responses before fingerprinting
+    VOLATILE_PATTERNS = [
+        re.compile(r'\snonce="[^"]*"'),
+        re.compile(r'<input[^>]+name="[^"]*(?:csrf|token|verification)[^"]*"[^>]*>', re.IGNORECASE),
+        re.compile(r'<meta[^>]+name="csrf[^"]*"[^>]*>', re.IGNORECASE),
+    ]
+
     def __init__(self, site_name, url):
         self.site_name = site_name
         self.url = url
@@ -15,42 +106,268 @@ class BaseFetcher:
             'Accept-Language': 'en-US,en;q=0.9'
         }
         self.timeout = 30  # Default timeout in seconds
-        self.max_retries = 3
+        self.page_concurrency = 8  # Max listing pages fetched at once by _fetch_pages
+        self.detail_concurrency = 4  # Max detail pages fetched at once by _fetch_details
+        # Previously stored jobs keyed by URL, used as a description cache by _fetch_details
+        self.known_jobs: Dict[str, Dict[str, Any]] = {}
+        # Process-wide keep-alive session, connections are reused across fetchers hitting the same host
+        self.session = get_session()
+        # Fingerprint of the listing at the last successful run (set by FetcherManager) and of this run
+        self.previous_listing_fingerprint: Optional[str] = None
+        self.listing_fingerprint: Optional[str] = None
+        # Time of the last successful run (UTC), set by FetcherManager
+        self.last_success_at: Optional[datetime] = None
     
+    @property
+    def paginated(self) -> bool:
+        """True when the fetcher downloads its listing page by page (iter_pages/parse_page)."""
+        return type(self).iter_pages is not BaseFetcher.iter_pages
+
+    @property
+    def streams_jobs(self) -> bool:
+        """True when the fetcher yields its listing page by page through iter_jobs."""
+        return self.paginated or type(self).iter_jobs is not BaseFetcher.iter_jobs
+
+    def iter_pages(self) -> Iterator[Any]:
+        """
+        Download stage of paginated fetchers: yields the raw content of each listing page
+        as it arrives. parse_page turns one page into jobs, keeping parsing separate from I/O.
+        """
+        raise NotImplementedError
+
+    def parse_page(self, content: Any) -> List[Dict[str, Any]]:
+        """Parse stage of paginated fetchers: extracts the jobs of one page yielded by iter_pages."""
+        raise NotImplementedError
+
+    def iter_jobs(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields parsed job data in batches (typically one per listing page) as they become
+        available, so FetcherManager can store early pages while later ones are still loading.
+        Paginated fetchers parse each page of iter_pages; otherwise fetch_jobs() is yielded
+        as a single batch, which keeps list-returning fetchers working unchanged.
+        """
+        if self.paginated:
+            for content in self.iter_pages():
+                yield self.parse_page(content)
+            return
+        yield self.fetch_jobs()
+
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetches job listings from the site and returns parsed job data.
         Returns list of job dicts or raises exception.
         """
+        if self.streams_jobs:
+            return [job for batch in self.iter_jobs() for job in batch]
+
         try:
             html = self._get_html()
+            self._check_listing(html)
             return self.parse_jobs(html)
         except Exception as e:
             logger.error(f"Error fetching jobs from {self.site_name}: {str(e)}")
             raise
+
+    async def fetch_jobs_async(self, session: aiohttp.ClientSession,
+                               parse_pool: Optional[Executor] = None) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of fetch_jobs used by the fetch engine.
+        Fetchers relying on the default fetch_jobs download on the event loop and parse in
+        parse_pool when they set parse_in_pool (otherwise in a worker thread);
+        fetchers that override fetch_jobs are adapted by running them in a worker thread.
+        """
+        if self.streams_jobs or type(self).fetch_jobs is not BaseFetcher.fetch_jobs:
+            return await asyncio.to_thread(self.fetch_jobs)
+
+        try:
+            html = await self._get_html_async(session)
+            self._check_listing(html)
+            if parse_pool is not None and self.parse_in_pool:
+                return await asyncio.get_running_loop().run_in_executor(
+                    parse_pool, parse_in_worker, type(self), 'parse_jobs', html
+                )
+            # parse_jobs is CPU-bound (and may still do blocking I/O), keep it off the event loop
+            return await asyncio.to_thread(self.parse_jobs, html)
+        except Exception as e:
+            logger.error(f"Error fetching jobs from {self.site_name}: {str(e)}")
+            raise
     
-    def _get_html(self) -> str:
+    def _check_listing(self, content: str) -> None:
+        """
+        Fingerprints a single-response listing (HTML or JSON payload) after removing
+        VOLATILE_PATTERNS and whitespace differences, together with the parser that reads it
+        (parser_version, the fetcher's code hash and the HTML parser backends), so a parser
+        fix or backend switch re-parses unchanged listings. Raises ListingUnchanged when it matches
+        the previous successful run. Call it before parsing, in fetchers whose whole listing
+        is one response; detail-page fetchers are exempt since their details may still change,
+        unless they set listing_covers_details.
         """
-        Makes HTTP GET request to the job site with retries.
+        normalized = content
+        for pattern in self.VOLATILE_PATTERNS:
+            normalized = pattern.sub('', normalized)
+        normalized = ' '.join(normalized.split())
+        parser = f"{self.parser_version}:{_code_hash(type(self))}:{current_parser()}:{current_css_backend()}\n"
+        self.listing_fingerprint = hashlib.sha256((parser + normalized).encode()).hexdigest()
+
+        if self.fetches_details and not self.listing_covers_details:
+            return
+        if self.previous_listing_fingerprint is None:
+            return
+        if self.listing_fingerprint == self.previous_listing_fingerprint:
+            logger.info(f"Listing of {self.site_name} unchanged since the last run, skipping parse")
+            raise ListingUnchanged(self.site_name)
+
+    def _soup(self, markup: Any, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parses HTML with the configured BeautifulSoup parser (see fetchers.html_parser).
+        Pass parse_only=SoupStrainer(...) to build just the job container instead of the whole page.
+        """
+        return make_soup(markup, parse_only)
+
+    def _css(self, markup: Any) -> CSSNode:
+        """Parses HTML for CSS-selector-only access, through selectolax when it is configured."""
+        return css_document(markup)
+
+    def _get_html(self, url: Optional[str] = None) -> str:
+        """
+        Makes HTTP GET request to the job site (or the given url).
+        Rate limits and retries of transient failures are handled by the session (fetchers.politeness).
         Returns HTML content as string or raises exception.
         """
-        retry_count = 0
-        last_exception = None
-        
-        while retry_count < self.max_retries:
+        url = url or self.url
+        logger.info(f"Fetching jobs from {self.site_name} at {url}")
+        try:
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()  # Raise exception for 4XX/5XX responses
+            return response.text
+        except RequestException as e:
+            logger.error(f"Failed to fetch jobs from {self.site_name} at {url}: {str(e)}")
+            raise
+
+    def _iter_pages(self, page_url: Callable[[int], str], count: int,
+                    ignore_errors: bool = False) -> Iterator[Tuple[int, Optional[str]]]:
+        """
+        Fetches pages 1..count concurrently, at most self.page_concurrency at a time,
+        and yields (page number, content) as each page completes, not in page order.
+        page_url maps a page number to its URL; with ignore_errors a failed page is
+        logged and yielded as None instead of raising.
+        """
+        urls = {page: page_url(page) for page in range(1, count + 1)}
+
+        def fetch(url: str) -> Optional[str]:
             try:
-                logger.info(f"Fetching jobs from {self.site_name} at {self.url}")
-                response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
-                response.raise_for_status()  # Raise exception for 4XX/5XX responses
-                return response.text
+                return self._get_html(url)
             except RequestException as e:
-                retry_count += 1
-                last_exception = e
-                logger.warning(f"Attempt {retry_count} failed for {self.site_name}: {str(e)}")
-        
-        # If we've exhausted retries, log and re-raise the last exception
-        logger.error(f"Failed to fetch jobs from {self.site_name} after {self.max_retries} attempts")
-        raise last_exception or RequestException(f"Failed to fetch jobs from {self.site_name}")
+                if not ignore_errors:
+                    raise
+                logger.error(f"Failed to fetch page {url} from {self.site_name}: {str(e)}")
+                return None
+
+        if len(urls) <= 1:
+            for page, url in urls.items():
+                yield page, fetch(url)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.page_concurrency, len(urls))) as executor:
+            futures = {executor.submit(bind_run_budget(fetch), url): page for page, url in urls.items()}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # Stopped early (error or closed generator): don't start the remaining pages
+                for future in futures:
+                    future.cancel()
+
+    def _fetch_pages(self, page_url: Callable[[int], str], count: int,
+                     ignore_errors: bool = False) -> List[Optional[str]]:
+        """
+        Fetches pages 1..count concurrently like _iter_pages, but returns the page
+        contents as a list in page order.
+        """
+        pages: List[Optional[str]] = [None] * count
+        for page, html in self._iter_pages(page_url, count, ignore_errors):
+            pages[page - 1] = html
+        return pages
+
+    def _fetch_details(self, urls: List[str],
+                       parse_detail: Callable[[str], Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches job detail pages concurrently, at most self.detail_concurrency at a time.
+        parse_detail turns a detail page into a dict of job fields. URLs already in
+        self.known_jobs are served from the stored job without a request.
+        Returns {url: fields}, with None for pages that failed to fetch or parse.
+        """
+        details = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            if url in self.known_jobs:
+                details[url] = self.known_jobs[url]
+            else:
+                pending.append(url)
+
+        def fetch(url: str) -> Optional[Dict[str, Any]]:
+            try:
+                return parse_detail(self._get_html(url))
+            except Exception as e:
+                logger.warning(f"Failed to fetch details for {url}: {str(e)}")
+                return None
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.detail_concurrency, len(pending))) as executor:
+                details.update(zip(pending, executor.map(bind_run_budget(fetch), pending)))
+
+        logger.info(f"{self.site_name}: {len(details) - len(pending)} job details cached, {len(pending)} fetched")
+        return details
+
+    async def _get_html_async(self, session: aiohttp.ClientSession) -> str:
+        """
+        Async counterpart of _get_html using the engine's shared aiohttp session.
+        Goes through the same per-host limits and retry policy as the requests sessions
+        and revalidates the archived response like they do (ETag/Last-Modified).
+        Returns HTML content as string or raises exception.
+        """
+        politeness = get_politeness()
+        limiter = politeness.limiter(self.url)
+        archive = get_archive()
+        meta = await asyncio.to_thread(archive.lookup_meta, 'GET', prepared_url(self.url)) if archive else None
+        headers = {**self.headers, **conditional_headers(meta)}
+
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                logger.info(f"Fetching jobs from {self.site_name} at {self.url}")
+                async with limiter.slot_async():
+                    async with session.get(self.url, headers=headers,
+                                           timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                        if response.status == 304 and meta is not None:
+                            logger.info(f"Not modified, using archived response for {self.url}")
+                            await asyncio.to_thread(archive.touch, 'GET', prepared_url(self.url))
+                            body = await asyncio.to_thread(archive.read_body, meta['digest'])
+                            return body.decode(meta['encoding'] or 'utf-8', errors='replace')
+                        retry_after = response.headers.get('Retry-After')
+                        response.raise_for_status()  # Raise exception for 4XX/5XX responses
+                        body = await response.read()
+                        if archive is not None:
+                            await asyncio.to_thread(archive.record, 'GET', prepared_url(self.url), None,
+                                                    response.status, body, dict(response.headers),
+                                                    response.get_encoding(),
+                                                    response.headers.getall('Set-Cookie', []))
+                        return await response.text()
+            except aiohttp.ClientResponseError as e:
+                if not politeness.is_retryable(e.status) or not politeness.allow_retry(attempt):
+                    raise
+                delay = politeness.retry_delay(attempt, retry_after)
+                if e.status in THROTTLE_STATUSES:
+                    limiter.pause(delay)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if not politeness.allow_retry(attempt):
+                    logger.error(f"Failed to fetch jobs from {self.site_name} after {attempt + 1} attempts")
+                    raise
+                delay = politeness.retry_delay(attempt)
+
+            logger.warning(f"Attempt {attempt + 1} failed for {self.site_name}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
     
     def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
         """
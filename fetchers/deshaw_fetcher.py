@@ -1,8 +1,6 @@
-import requests
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 
 logger = logging.getLogger(__name__)
@@ -15,9 +13,10 @@ class DEShawFetcher(BaseFetcher):
         )
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
-        response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+        response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        self._check_listing(response.text)
+        soup = self._soup(response.text)
 
         jobs = []
         job_elements = soup.find_all('div', class_='job')
@@ -1,14 +1,14 @@
-import requests
 import logging
-import json
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
+from .embedded_json import next_data
 
 logger = logging.getLogger(__name__)
 
 class DRWFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="DRW",
@@ -16,11 +16,7 @@ class DRWFetcher(BaseFetcher):
         )
 
     def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, 'html.parser')
-        script_tag = soup.find('script', id='__NEXT_DATA__')
-        if not script_tag:
-            raise ValueError("__NEXT_DATA__ script tag not found")
-        data = json.loads(script_tag.string)['props']
+        data = next_data(html)['props']
         
         jobs_data = data.get('pageProps', {}).get('jobData', {}).get('en', [])
         
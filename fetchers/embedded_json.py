@@ -0,0 +1,103 @@
+"""
+Extraction of JSON payloads embedded in HTML pages and scripts: Next.js __NEXT_DATA__,
+JavaScript assignments (window.__appData = {...}), object properties ("key": {...}) and
+JSON passed as a quoted JavaScript string (init('[...]')).
+Blobs are located with str.find or anchored regexes and decoded in a single pass with
+json.JSONDecoder.raw_decode, which stops at the end of the value, so no brace balancing
+and no DOM build over the whole document is needed.
+"""
+import json
+import re
+from typing import Any, Tuple
+
+# strict=False accepts raw control characters (e.g. newlines) inside strings, common in inline scripts
+_decoder = json.JSONDecoder(strict=False)
+
+_WHITESPACE = re.compile(r'\s*')
+# Backslash escapes of a JavaScript string literal, plus bare double quotes to re-escape for JSON
+_JS_ESCAPE = re.compile(r'\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|\r\n|.)|"', re.DOTALL)
+_JS_SIMPLE_ESCAPES = {'n': '\\n', 't': '\\t', 'r': '\\r', 'b': '\\b', 'f': '\\f', 'v': '\\u000b',
+                      '0': '\\u0000', '"': '\\"', '\\': '\\\\', '/': '/', '\n': '', '\r\n': ''}
+_NEXT_DATA = re.compile(r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>')
+
+
+def decode_at(text: str, index: int) -> Tuple[Any, int]:
+    """Decodes the JSON value starting at index (after optional whitespace). Returns (value, end index)."""
+    index = _WHITESPACE.match(text, index).end()
+    try:
+        return _decoder.raw_decode(text, index)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid embedded JSON at offset {index}: {str(e)}") from e
+
+
+def next_data(html: str) -> Any:
+    """Returns the Next.js page data from the __NEXT_DATA__ script tag."""
+    match = _NEXT_DATA.search(html)
+    if not match:
+        raise ValueError("__NEXT_DATA__ script tag not found")
+    return decode_at(html, match.end())[0]
+
+
+def js_assignment(text: str, target: str, start: int = 0) -> Any:
+    """Returns the JSON value assigned to target, e.g. js_assignment(html, 'window.__appData')."""
+    match = re.compile(re.escape(target) + r'\s*=\s*').search(text, start)
+    if not match:
+        raise ValueError(f"Assignment to {target} not found")
+    return decode_at(text, match.end())[0]
+
+
+def json_property(text: str, key: str, start: int = 0) -> Any:
+    """Returns the value of the first "key": ... property found in text."""
+    match = re.compile(re.escape(json.dumps(key)) + r'\s*:\s*').search(text, start)
+    if not match:
+        raise ValueError(f"Property {key!r} not found")
+    return decode_at(text, match.end())[0]
+
+
+def js_string_at(text: str, index: int) -> Tuple[str, int]:
+    """
+    Decodes the JavaScript string literal ('...' or "...") starting at index.
+    Returns (string, end index).
+    """
+    quote = text[index]
+    if quote not in '\'"':
+        raise ValueError(f"No string literal at offset {index}")
+
+    # Scan to the closing quote, skipping escaped characters
+    end = index + 1
+    while True:
+        end = text.find(quote, end)
+        if end == -1:
+            raise ValueError(f"Unterminated string literal at offset {index}")
+        backslashes = 0
+        while text[end - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            break
+        end += 1
+
+    def to_json_escape(match: re.Match) -> str:
+        escape = match.group(1)
+        if escape is None:
+            return '\\"'
+        if escape[0] == 'x':
+            return '\\u00' + escape[1:]
+        if escape[0] == 'u' and len(escape) == 5:
+            return '\\' + escape
+        return _JS_SIMPLE_ESCAPES.get(escape, escape)
+
+    body = _JS_ESCAPE.sub(to_json_escape, text[index + 1:end])
+    return _decoder.decode(f'"{body}"'), end + 1
+
+
+def quoted_json(text: str, marker: str, start: int = 0) -> Any:
+    """
+    Returns the JSON encoded in the first string literal following marker,
+    e.g. quoted_json(html, 'CSSearchModule.init(') for CSSearchModule.init('[{...}]', ...).
+    """
+    index = text.find(marker, start)
+    if index == -1:
+        raise ValueError(f"{marker!r} not found")
+    index = _WHITESPACE.match(text, index + len(marker)).end()
+    payload, _ = js_string_at(text, index)
+    return decode_at(payload, 0)[0]
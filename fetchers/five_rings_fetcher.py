@@ -1,5 +1,4 @@
 from datetime import datetime
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher  # 假设存在基础爬虫类
 
 class FiveRingsFetcher(BaseFetcher):
@@ -8,7 +7,8 @@ class FiveRingsFetcher(BaseFetcher):
 
     def fetch_jobs(self):
         html = self._get_html()
-        soup = BeautifulSoup(html, 'html.parser')
+        self._check_listing(html)
+        soup = self._soup(html)
         
         jobs = []
         for item in soup.select('div.gh-item'):
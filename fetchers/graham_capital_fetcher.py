@@ -1,9 +1,10 @@
 from datetime import datetime
 from .base_fetcher import BaseFetcher
-from bs4 import BeautifulSoup
 import re
 
 class GrahamCapitalFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="Graham Capital",
@@ -12,7 +13,7 @@ class GrahamCapitalFetcher(BaseFetcher):
     
     def parse_jobs(self, html: str) -> list:
         """Parse HTML to extract job listings from Graham Capital careers page"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         jobs = []
         
         # Find the section with "What We Do At Graham" heading
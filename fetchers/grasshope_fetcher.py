@@ -1,5 +1,3 @@
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
 import logging
@@ -15,9 +13,10 @@ class GrasshopeFetcher(BaseFetcher):
     
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            self._check_listing(response.text)
+            soup = self._soup(response.text)
             
             jobs = []
             job_list = soup.find('ul', class_='job_list')
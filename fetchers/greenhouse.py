@@ -0,0 +1,156 @@
+import html
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .base_fetcher import BaseFetcher
+
+logger = logging.getLogger(__name__)
+
+
+def html_to_text(content: str) -> str:
+    """Turns Greenhouse job content (HTML-escaped HTML) into plain text without building a DOM."""
+    if not content:
+        return ''
+    text = html.unescape(content)
+    text = re.sub(r'<\s*(br|/p|/li|/h\d|/div)\s*/?>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = html.unescape(text).replace('\u00a0', ' ')
+    lines = (' '.join(line.split()) for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parses a Greenhouse ISO 8601 timestamp into a naive UTC datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class GreenhouseFetcher(BaseFetcher):
+    """
+    Fetcher for boards hosted on Greenhouse, read through the public boards API
+    instead of scraping board pages. Each board's jobs are listed in one request
+    (boards are fetched concurrently) and job content is only requested for jobs
+    that are new or were updated since the last successful run; when most of a board
+    needs content (e.g. the first run) a single content=true request is used instead.
+    Subclasses pass their board tokens and may override _job_url and _build_description.
+    """
+    fetches_details = True
+    # Listings carry every job's updated_at, an identical listing means unchanged content
+    # (fetch_jobs drops the fingerprint when any content failed to load, so it is retried)
+    listing_covers_details = True
+    # Set to False when the description is built from listing fields only
+    needs_content = True
+    # Above this many jobs needing content, fetch the whole board with content=true
+    content_batch_threshold = 10
+
+    def __init__(self, site_name: str, boards: Sequence[str], api_host: str = 'boards-api.greenhouse.io'):
+        self.boards = list(boards)
+        self.api_host = api_host
+        super().__init__(site_name=site_name, url=self._board_url(self.boards[0]))
+
+    def _board_url(self, board: str, content: bool = False) -> str:
+        url = f"https://{self.api_host}/v1/boards/{board}/jobs"
+        return f"{url}?content=true" if content else url
+
+    def _job_api_url(self, board: str, job_id: str) -> str:
+        return f"https://{self.api_host}/v1/boards/{board}/jobs/{job_id}"
+
+    def fetch_jobs(self) -> List[Dict[str, Any]]:
+        # A failed board fails the fetch, storing a partial listing would close the other board's jobs
+        listings = self._fetch_pages(lambda page: self._board_url(self.boards[page - 1]), len(self.boards))
+        self._check_listing('\n'.join(listings))
+
+        jobs = []
+        missing_content = 0
+        for board, listing in zip(self.boards, listings):
+            postings = json.loads(listing).get('jobs', [])
+            descriptions, missing = self._load_descriptions(board, postings)
+            missing_content += missing
+            for posting in postings:
+                try:
+                    jobs.append(self._build_job(posting, descriptions.get(str(posting['id']), '')))
+                except Exception as e:
+                    logger.warning(f"Error processing job {posting.get('id')} from {self.site_name}: {str(e)}")
+
+        if missing_content:
+            # Not storing the fingerprint lets the next run past _check_listing to retry the content
+            logger.warning(f"{self.site_name}: content of {missing_content} jobs failed to load, "
+                           f"retrying them on the next run")
+            self.listing_fingerprint = None
+
+        logger.info(f"Fetched {len(jobs)} jobs from {self.site_name}")
+        return jobs
+
+    def _load_descriptions(self, board: str, postings: List[Dict[str, Any]]) -> Tuple[Dict[str, str], int]:
+        """
+        Returns ({job id: description}, number of jobs whose content failed to load): stored
+        descriptions for jobs not updated since the last successful run, freshly built ones for
+        the rest. Jobs whose content failed to load get an empty description, which
+        FetcherManager leaves out of known_jobs, so the next run requests them again.
+        """
+        descriptions = {}
+        stale = []
+        for posting in postings:
+            job_id = str(posting['id'])
+            known = self.known_jobs.get(job_id)
+            updated_at = parse_timestamp(posting.get('updated_at'))
+            updated = updated_at is None or self.last_success_at is None or updated_at > self.last_success_at
+            if known and not updated:
+                descriptions[job_id] = known['description']
+            elif not self.needs_content:
+                descriptions[job_id] = self._build_description(posting, {})
+            else:
+                stale.append(job_id)
+
+        if not stale:
+            return descriptions, 0
+
+        if len(stale) > self.content_batch_threshold:
+            response = self.session.get(self._board_url(board, content=True), headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+            details = {str(job['id']): job for job in response.json().get('jobs', [])}
+        else:
+            urls = {job_id: self._job_api_url(board, job_id) for job_id in stale}
+            fetched = self._fetch_details(list(urls.values()), json.loads)
+            details = {job_id: fetched.get(url) for job_id, url in urls.items()}
+
+        postings_by_id = {str(posting['id']): posting for posting in postings}
+        missing = 0
+        for job_id in stale:
+            detail = details.get(job_id)
+            if detail:
+                descriptions[job_id] = self._build_description(postings_by_id[job_id], detail)
+            else:
+                descriptions[job_id] = ''
+                missing += 1
+        return descriptions, missing
+
+    def _build_job(self, posting: Dict[str, Any], description: str) -> Dict[str, Any]:
+        return {
+            'job_id': str(posting['id']),
+            'title': posting.get('title', ''),
+            'description': description,
+            'url': self._job_url(posting),
+            'location': (posting.get('location') or {}).get('name', ''),
+            'posted_date': parse_timestamp(posting.get('first_published') or posting.get('updated_at'))
+        }
+
+    def _job_url(self, posting: Dict[str, Any]) -> str:
+        return posting.get('absolute_url', '')
+
+    def _build_description(self, posting: Dict[str, Any], detail: Dict[str, Any]) -> str:
+        """Builds the description from the job's detail (listing fields plus content and departments)."""
+        departments = [department['name'] for department in detail.get('departments', []) if department.get('name')]
+        text = html_to_text(detail.get('content', ''))
+        if departments:
+            return f"Departments: {', '.join(departments)}\n\n{text}"
+        return text
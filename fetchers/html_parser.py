@@ -0,0 +1,137 @@
+"""
+HTML parser backends for the fetchers.
+BeautifulSoup trees are built with html.parser and CSS-only parsing goes through BeautifulSoup
+by default. lxml (several times faster than the pure-Python html.parser) and selectolax's lexbor
+engine can be selected when installed, but they repair malformed markup differently, so they are
+opt-in (HTML_PARSER/CSS_BACKEND) once benchmarks/bench_parsers.py finds the same jobs with them.
+BaseFetcher._soup and BaseFetcher._css are the entry points.
+"""
+import importlib.util
+import logging
+from typing import Any, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# Fastest first; the defaults every fetcher was written against
+HTML_PARSERS = ('lxml', 'html.parser')
+CSS_BACKENDS = ('selectolax', 'bs4')
+DEFAULT_PARSER = 'html.parser'
+DEFAULT_CSS_BACKEND = 'bs4'
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def available_parsers() -> List[str]:
+    return [parser for parser in HTML_PARSERS if parser == 'html.parser' or _installed(parser)]
+
+
+def available_css_backends() -> List[str]:
+    return [backend for backend in CSS_BACKENDS if backend == 'bs4' or _installed(backend)]
+
+
+_parser = DEFAULT_PARSER
+_css_backend = DEFAULT_CSS_BACKEND
+
+
+def configure_parser(parser: Optional[str] = None, css_backend: Optional[str] = None) -> None:
+    """
+    Selects the BeautifulSoup parser and the CSS backend for this process
+    (None keeps the current choice, by default html.parser and bs4).
+    """
+    global _parser, _css_backend
+    if parser:
+        if parser not in available_parsers():
+            raise ValueError(f"HTML parser {parser!r} is not installed (available: {available_parsers()})")
+        _parser = parser
+    if css_backend:
+        if css_backend not in available_css_backends():
+            raise ValueError(f"CSS backend {css_backend!r} is not installed "
+                             f"(available: {available_css_backends()})")
+        _css_backend = css_backend
+    logger.info(f"Parsing HTML with {_parser}, CSS queries with {_css_backend}")
+
+
+def current_parser() -> str:
+    return _parser
+
+
+def current_css_backend() -> str:
+    return _css_backend
+
+
+def make_soup(markup: Any, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Builds a BeautifulSoup tree with the configured parser. With parse_only only the
+    elements matched by the SoupStrainer (e.g. the job container) and their descendants
+    are built, the rest of the document is skipped.
+    """
+    return BeautifulSoup(markup, _parser, parse_only=parse_only)
+
+
+class CSSNode:
+    """
+    Minimal CSS-select interface shared by the selectolax and BeautifulSoup backends:
+    select/select_one return CSSNodes, text() and attr() read the node.
+    """
+
+    def __init__(self, node: Any):
+        self.node = node
+
+    def select(self, selector: str) -> List['CSSNode']:
+        raise NotImplementedError
+
+    def select_one(self, selector: str) -> Optional['CSSNode']:
+        raise NotImplementedError
+
+    def text(self, strip: bool = True) -> str:
+        raise NotImplementedError
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        raise NotImplementedError
+
+
+class _SelectolaxNode(CSSNode):
+    def select(self, selector: str) -> List[CSSNode]:
+        return [_SelectolaxNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional[CSSNode]:
+        node = self.node.css_first(selector)
+        return _SelectolaxNode(node) if node is not None else None
+
+    def text(self, strip: bool = True) -> str:
+        return self.node.text(strip=strip)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self.node.attributes.get(name)
+        return value if value is not None else default
+
+
+class _SoupNode(CSSNode):
+    def select(self, selector: str) -> List[CSSNode]:
+        return [_SoupNode(tag) for tag in self.node.select(selector)]
+
+    def select_one(self, selector: str) -> Optional[CSSNode]:
+        tag = self.node.select_one(selector)
+        return _SoupNode(tag) if tag is not None else None
+
+    def text(self, strip: bool = True) -> str:
+        return self.node.get_text(strip=strip)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self.node.get(name)
+        if isinstance(value, list):  # Multi-valued attributes such as class
+            value = ' '.join(value)
+        return value if value is not None else default
+
+
+def css_document(markup: Any) -> CSSNode:
+    """Parses markup with the configured CSS backend."""
+    if _css_backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+        if isinstance(markup, bytes):
+            markup = markup.decode('utf-8', errors='replace')
+        return _SelectolaxNode(LexborHTMLParser(markup))
+    return _SoupNode(make_soup(markup))
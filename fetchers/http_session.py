@@ -0,0 +1,98 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from .archive import ConditionalSession, ReplaySession, ResponseArchive, get_archive
+from .politeness import PoliteSession
+
+# urllib3 only decodes brotli bodies when one of these packages is installed,
+# so only advertise 'br' when we can actually read the response.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+POOL_CONNECTIONS = 64  # Number of distinct hosts kept alive in the pool
+POOL_MAXSIZE = 10  # Connections kept (and allowed concurrently) per host
+
+_lock = threading.Lock()
+_adapter = None
+_session = None
+_replay_archive = None
+_replay_misses = []
+
+
+def get_adapter() -> HTTPAdapter:
+    """
+    Returns the process-wide connection pool shared by every fetcher.
+    pool_block makes POOL_MAXSIZE a hard per-host limit instead of opening throwaway connections.
+    """
+    global _adapter
+    with _lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, pool_block=True)
+        return _adapter
+
+
+class FetchSession(PoliteSession, ConditionalSession):
+    """Per-host limits and retries (PoliteSession) around archive revalidation (ConditionalSession)."""
+
+
+def _archive_response(response: requests.Response, *args, **kwargs) -> None:
+    """Response hook storing raw responses in the archive when one is configured."""
+    archive = get_archive()
+    if archive is not None:
+        archive.record_response(response)
+
+
+def new_session() -> requests.Session:
+    """
+    Creates a session with its own cookie jar that reuses the shared connection pool.
+    Use it for flows that depend on site cookies (e.g. CSRF bootstrapping).
+    Requests go through the per-host rate limits and retries of fetchers.politeness, and GET
+    requests are revalidated against the response archive (ETag/Last-Modified);
+    in replay mode the session answers from the archive instead.
+    """
+    if _replay_archive is not None:
+        session = ReplaySession(_replay_archive, _replay_misses)
+    else:
+        session = FetchSession()
+        adapter = get_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.hooks['response'].append(_archive_response)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    return session
+
+
+def enable_replay(archive: ResponseArchive) -> None:
+    """
+    Makes every session created from now on replay archived responses (used by reparse).
+    Also starts a new list of replay_misses.
+    """
+    global _session, _replay_archive, _replay_misses
+    with _lock:
+        _replay_archive = archive
+        _replay_misses = []
+        _session = None
+
+
+def replay_misses() -> list:
+    """Requests of the current replay that were not in the archive."""
+    with _lock:
+        return list(_replay_misses)
+
+
+def get_session() -> requests.Session:
+    """Returns the process-wide keep-alive session."""
+    global _session
+    if _session is None:
+        session = new_session()
+        with _lock:
+            if _session is None:
+                _session = session
+    return _session
@@ -1,8 +1,6 @@
-import requests
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 
 logger = logging.getLogger(__name__)
@@ -13,14 +11,14 @@ class HudsonRiverTradingFetcher(BaseFetcher):
             site_name="Hudson River Trading",
             url="https://www.hudsonrivertrading.com/careers/"
         )
-        self.session = requests.Session()
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         jobs = []
         try:
             response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self._check_listing(response.text)
+            soup = self._soup(response.content)
             
             table = soup.find('table', {'class': 'jobs-container'})
             if not table:
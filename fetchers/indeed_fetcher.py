@@ -4,6 +4,9 @@ import re
 from .base_fetcher import BaseFetcher
 
 class IndeedFetcher(BaseFetcher):
+    # Demo fetcher, not run by FetcherManager
+    enabled = False
+
     def __init__(self):
         # In a real implementation, this would be a valid Indeed jobs search URL
         super().__init__(site_name="Indeed", url="https://www.indeed.com/jobs")
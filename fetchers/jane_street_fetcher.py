@@ -1,6 +1,4 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
 
@@ -15,14 +13,15 @@ class JaneStreetFetcher(BaseFetcher):
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
+            self._check_listing(response.text)
             jobs_data = response.json()
 
             return [
                 {
                     'title': job.get('position', ''),
-                    'description': BeautifulSoup(job.get('overview', ''), 'html.parser').get_text(),
+                    'description': self._soup(job.get('overview', '')).get_text(),
                     'url': f"https://www.janestreet.com/join-jane-street/position/{job.get('id', '')}",
                     'location': job.get('city', ''),
                     'posted_date': None  # API doesn't provide posting dates
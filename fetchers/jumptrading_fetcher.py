@@ -1,8 +1,6 @@
-import requests
 import logging
 import re
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 
 logger = logging.getLogger(__name__)
@@ -18,7 +16,8 @@ class JumpTradingFetcher(BaseFetcher):
         jobs = []
         try:
             html = self._get_html()
-            soup = BeautifulSoup(html, 'html.parser')
+            self._check_listing(html)
+            soup = self._soup(html)
             
             a_tags = []
             for a_tag in soup.find_all('a', {'role': 'listitem', 'href': True}):
@@ -4,6 +4,9 @@ import re
 from .base_fetcher import BaseFetcher
 
 class LinkedInFetcher(BaseFetcher):
+    # Demo fetcher, not run by FetcherManager
+    enabled = False
+
     def __init__(self):
         # In a real implementation, this would be a valid LinkedIn jobs search URL
         super().__init__(site_name="LinkedIn", url="https://www.linkedin.com/jobs/search/")
@@ -1,8 +1,9 @@
 from datetime import datetime
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 
 class LMRPartnersFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="LMR Multi-Strategy",
@@ -11,7 +12,7 @@ class LMRPartnersFetcher(BaseFetcher):
     
     def parse_jobs(self, html: str) -> list:
         """Parse HTML to extract job listings from LMR Partners careers page"""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         jobs = []
         
         # Find all card elements that contain job listings
@@ -1,4 +1,3 @@
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 from datetime import datetime
 
@@ -8,7 +7,8 @@ class MakoFetcher(BaseFetcher):
 
     def fetch_jobs(self):
         html = self._get_html()
-        soup = BeautifulSoup(html, 'html.parser')
+        self._check_listing(html)
+        soup = self._soup(html)
         
         jobs = []
         for item in soup.select('div.job-entry'):
@@ -1,4 +1,3 @@
-import requests
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
@@ -17,7 +16,7 @@ class MillenniumFetcher(BaseFetcher):
     def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
         """Fetches and parses job data from Eightfold API"""
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -3,6 +3,8 @@ from .base_fetcher import BaseFetcher
 import json
 
 class NorthRockFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="NorthRock",
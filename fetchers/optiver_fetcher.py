@@ -1,13 +1,14 @@
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from .base_fetcher import BaseFetcher
 import logging
 
 logger = logging.getLogger(__name__)
 
 class OptiverFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="Optiver",
@@ -15,32 +16,28 @@ class OptiverFetcher(BaseFetcher):
         )
         self.base_url = "https://optiver.com/working-at-optiver/career-opportunities/page/{page}/"
 
-    def fetch_jobs(self) -> List[Dict[str, Any]]:
+    def iter_pages(self) -> Iterator[str]:
         try:
             # Get initial page to determine total pages
-            initial_page = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            initial_page = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             initial_page.raise_for_status()
-            soup = BeautifulSoup(initial_page.content, 'html.parser')
+            soup = self._soup(initial_page.content)
             
             total_pages = self._get_total_pages(soup)
             logger.info(f"Fetching {total_pages} pages from {self.site_name}")
-            jobs = []
             
-            # Iterate through all pages
-            for page in range(1, total_pages + 1):
-                page_url = self.base_url.format(page=page)
-                response = requests.get(page_url, headers=self.headers, timeout=self.timeout)
-                response.raise_for_status()
-                
-                page_soup = BeautifulSoup(response.content, 'html.parser')
-                jobs.extend(self._parse_page(page_soup))
-                
-            return jobs
+            # Fetch all pages concurrently, each page is yielded as soon as it arrives
+            for _, html in self._iter_pages(lambda page: self.base_url.format(page=page), total_pages):
+                yield html
 
         except Exception as e:
             logger.error(f"Error fetching jobs from {self.site_name}: {str(e)}")
             raise
 
+    def parse_page(self, content: str) -> List[Dict[str, Any]]:
+        # Only the result list is built, not the rest of the page
+        return self._parse_page(self._soup(content, SoupStrainer('div', class_='result items items-viewmode-list')))
+
     def _get_total_pages(self, soup: BeautifulSoup) -> int:
         pagination = soup.find('div', class_='pagination')
         if not pagination:
@@ -1,57 +1,31 @@
-import requests
 import logging
-import json
-import ast
 from datetime import datetime
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
+from .embedded_json import quoted_json
+from .http_session import new_session
 
 logger = logging.getLogger(__name__)
 
-import re
-
 class Point72Fetcher(BaseFetcher):
     def __init__(self):
         super().__init__(
             site_name="Point72",
             url="https://careers.point72.com/?_gl=1*1u1k88n*_ga*MTc3NDQ2NTE3NS4xNzMwOTg3NTc3*_ga_DP94T093JK*MTc0NTIxNTQ0Mi4xLjEuMTc0NTIxNTYxOC4wLjAuMA.."
         )
-        self.session = requests.Session()
+        self.session = new_session()  # Own cookie jar, shared connection pool
         self.session.verify = False
 
     
 
     def _clean_html_description(self, html: str) -> str:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         for tag in ['script', 'style', 'img', 'link']:
             for element in soup.find_all(tag):
                 element.decompose()
         text = soup.get_text(separator='\n')
         return '\n'.join(line.strip() for line in text.split('\n') if line.strip())
 
-    def extract_between_quotes(self, input_string: str):
-        # Find the index of the first single quote
-        first_quote_index = input_string.find("'")
-        if first_quote_index == -1:
-            return None
-
-        # Find the index of the second single quote
-        second_quote_index = input_string.find("',", first_quote_index + 1)
-        if second_quote_index == -1:
-            return None
-
-        # Extract the substring between the first and second single quotes
-        return input_string[first_quote_index + 1:second_quote_index]
-
-    def json_str_cleanup(self, raw_string: str) -> str:
-        cleaned = raw_string.replace('\\\\', '__BACKSLASH__')
-        cleaned = cleaned.replace('\\"', '"')
-        cleaned = cleaned.replace('__BACKSLASH__', '\\')
-        cleaned = cleaned.replace("\\'", "'")
-        cleaned = re.sub(r'"Job_Description_External__c":.*?"Company__c"', '"Job_Description_External__c":"","Company__c"', cleaned)
-        return cleaned
-
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         jobs = []
         response = self.session.get(
@@ -60,22 +34,10 @@ class Point72Fetcher(BaseFetcher):
             timeout=self.timeout
         )
         response.raise_for_status()
+        self._check_listing(response.text)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        script = soup.find('script', string=lambda t: 'CSSearchModule.init' in (t or ''))
-        
-        if not script:
-            raise ValueError("Job data script not found")
-
-        json_str = self.json_str_cleanup(self.extract_between_quotes(script.text))
-        if not json_str:
-            logger.error(f"Script content: {script.text[:2000]}")
-            raise ValueError("Job data pattern not found in script")
-
-        try:
-            job_data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON data: {str(e)}") from e
+        # The job data is passed to CSSearchModule.init as a single-quoted JSON string
+        job_data = quoted_json(response.text, 'CSSearchModule.init(')
 
         for item in job_data:
             job = item['job']
@@ -0,0 +1,272 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying; the throttling ones also pause the whole host
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Parses a Retry-After header (delay in seconds or an HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class RetryBudget:
+    """Retries allowed across all sites in one fetch run, so a struggling host cannot stall the run."""
+
+    def __init__(self, total: Optional[int]):
+        self.total = total
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    def spend(self) -> bool:
+        """Takes one retry from the budget, False once it is exhausted (None means unlimited)."""
+        with self._lock:
+            if self.total is not None and self.spent >= self.total:
+                return False
+            self.spent += 1
+            return True
+
+
+# Budget of the fetch run the current task/thread belongs to, see Politeness.begin_run
+_run_budget: ContextVar[Optional[RetryBudget]] = ContextVar('run_retry_budget', default=None)
+
+
+def bind_run_budget(fn: Callable) -> Callable:
+    """
+    Wraps fn so it spends the calling run's retry budget when executed on another thread
+    (ThreadPoolExecutor workers do not inherit context variables, asyncio.to_thread does).
+    """
+    budget = _run_budget.get()
+
+    def bound(*args, **kwargs):
+        token = _run_budget.set(budget)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _run_budget.reset(token)
+
+    return bound
+
+
+class HostLimiter:
+    """
+    Token bucket (rate requests per second, bursts of up to burst) plus a cap on concurrent
+    requests for one host. A throttled host can be paused, delaying every request to it.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        # Requests sent while the thread already holds a slot (redirects) don't take another one
+        self._held = threading.local()
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long the caller has to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.paused_until - now)
+            if self.rate <= 0:
+                return wait
+            self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Tokens may go negative: later callers queue up behind the ones already waiting
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Delays every request to the host for the next seconds (e.g. after a 429)."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    @contextmanager
+    def slot(self):
+        """Blocks until the host has a free slot and a token."""
+        if getattr(self._held, 'active', False):
+            yield
+            return
+        self._slots.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+            self._held.active = True
+            yield
+        finally:
+            self._held.active = False
+            self._slots.release()
+
+    @asynccontextmanager
+    async def slot_async(self):
+        """Async counterpart of slot, waiting on the event loop instead of blocking it."""
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(0.05)
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self._slots.release()
+
+
+class Politeness:
+    """
+    Shared request policy of the fetchers: per-host rate and concurrency limits,
+    retries of transient failures (connection errors, RETRY_STATUSES) with exponential
+    backoff and full jitter, Retry-After honoring, and a retry budget per fetch run.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 10, max_per_host: int = 8, max_retries: int = 3,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0, retry_budget: Optional[int] = 100):
+        self.rate = rate
+        self.burst = burst
+        self.max_per_host = max_per_host
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_budget = retry_budget
+        # Spent by requests made outside a fetch run (e.g. benchmarks)
+        self.budget = RetryBudget(retry_budget)
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> 'Politeness':
+        return cls(
+            rate=float(config.get('FETCH_HOST_RATE', 5.0)),
+            burst=int(config.get('FETCH_HOST_BURST', 10)),
+            max_per_host=int(config.get('FETCH_HOST_CONCURRENCY', 8)),
+            max_retries=int(config.get('FETCH_MAX_RETRIES', 3)),
+            backoff_base=float(config.get('FETCH_BACKOFF_BASE_SECONDS', 1.0)),
+            backoff_max=float(config.get('FETCH_BACKOFF_MAX_SECONDS', 60.0)),
+            retry_budget=config.get('FETCH_RETRY_BUDGET', 100)
+        )
+
+    def limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = HostLimiter(self.rate, self.burst, self.max_per_host)
+            return limiter
+
+    @staticmethod
+    def is_retryable(status: int) -> bool:
+        return status in RETRY_STATUSES
+
+    def allow_retry(self, attempt: int) -> bool:
+        """Whether a request that failed on its attempt-th try (from 0) may be sent again."""
+        if attempt + 1 >= self.max_retries:
+            return False
+        if not (_run_budget.get() or self.budget).spend():
+            logger.warning("Retry budget of this run exhausted, not retrying")
+            return False
+        return True
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds before the next try: the server's Retry-After if given, else jittered exponential backoff."""
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def begin_run(self) -> RetryBudget:
+        """
+        Gives the fetch run running in the current context its own retry budget: tasks and
+        asyncio.to_thread calls started from here on spend it, so overlapping runs don't share one.
+        """
+        budget = RetryBudget(self.retry_budget)
+        _run_budget.set(budget)
+        return budget
+
+
+class PoliteSession(requests.Session):
+    """
+    Session sending every request through the politeness layer: requests wait for a slot
+    of their host, and transient failures are retried with backoff before reaching the caller.
+    """
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        politeness = get_politeness()
+        limiter = politeness.limiter(request.url)
+        attempt = 0
+        while True:
+            response, error = None, None
+            with limiter.slot():
+                try:
+                    response = super().send(request, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+            if response is not None and not politeness.is_retryable(response.status_code):
+                return response
+            if not politeness.allow_retry(attempt):
+                if error is not None:
+                    raise error
+                return response
+
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            delay = politeness.retry_delay(attempt, retry_after)
+            if response is not None:
+                if response.status_code in THROTTLE_STATUSES:
+                    limiter.pause(delay)
+                response.close()
+            logger.warning(f"{request.method} {request.url} failed ({error or response.status_code}), "
+                           f"retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+
+_politeness = Politeness()
+
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_politeness(config: Mapping[str, Any], replace: bool = True) -> Politeness:
+    """
+    Sets the process-wide politeness settings. Replacing them drops the host limiters
+    (pauses and in-flight slot counts), so it belongs at startup, not at the start of a run;
+    with replace=False a process that is already configured keeps its settings and limiters.
+    """
+    global _politeness, _configured
+    with _configure_lock:
+        if replace or not _configured:
+            _politeness = Politeness.from_config(config)
+            _configured = True
+        return _politeness
+
+
+def get_politeness() -> Politeness:
+    return _politeness
@@ -0,0 +1,253 @@
+"""
+Registry of the available fetchers.
+Fetchers are discovered without importing them: every fetchers/*_fetcher.py module, plus modules
+registered by other packages under the 'jd_fetcher.fetchers' entry point group
+(e.g. `my_site = "my_package.my_site:MySiteFetcher"`), is read with ast to find its fetcher
+class and metadata. A fetcher module is only imported when FetcherSpec.load/create is called.
+"""
+import ast
+import importlib
+import importlib.metadata
+import importlib.util
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'jd_fetcher.fetchers'
+
+# Fetcher base classes and the ATS (applicant tracking system) type they imply
+BASE_CLASSES = {
+    'BaseFetcher': 'custom',
+    'GreenhouseFetcher': 'greenhouse',
+    'WorkdayFetcher': 'workday',
+}
+
+# Cost classes, cheapest first: one listing request, several listing pages, per-job detail requests
+COST_CLASSES = ('single', 'paged', 'detail')
+
+
+@dataclass(frozen=True)
+class FetcherSpec:
+    """Metadata of a fetcher read from its source, and how to import it."""
+    site_name: str
+    module: str
+    class_name: str
+    ats: str = 'custom'
+    cost: str = 'single'
+    parse_in_pool: bool = False
+    enabled: bool = True
+    source: str = 'package'  # or 'entry_point'
+    tags: Tuple[str, ...] = ()  # Declared by the fetcher class
+
+    @property
+    def all_tags(self) -> FrozenSet[str]:
+        """Tags runs can select the fetcher by: its ATS type, its cost class and its declared tags."""
+        return frozenset((self.ats, self.cost, *(tag.lower() for tag in self.tags)))
+
+    def load(self) -> type:
+        """Imports the fetcher's module and returns its class."""
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def create(self):
+        """Imports and instantiates the fetcher."""
+        return self.load()()
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'site_name': self.site_name,
+            'ats': self.ats,
+            'cost': self.cost,
+            'enabled': self.enabled,
+            'source': self.source,
+            'tags': sorted(self.all_tags),
+        }
+
+
+def _literal(node: ast.AST):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def _base_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _site_name(class_node: ast.ClassDef) -> Optional[str]:
+    """The site_name passed to super().__init__ in the class's __init__."""
+    for item in class_node.body:
+        if not (isinstance(item, ast.FunctionDef) and item.name == '__init__'):
+            continue
+        for node in ast.walk(item):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == '__init__'):
+                continue
+            for keyword in node.keywords:
+                if keyword.arg == 'site_name':
+                    return _literal(keyword.value)
+            if node.args:
+                return _literal(node.args[0])
+    return None
+
+
+def _spec_from_class(class_node: ast.ClassDef, module: str, source: str) -> Optional[FetcherSpec]:
+    bases = [_base_name(base) for base in class_node.bases]
+    ats = next((BASE_CLASSES[base] for base in bases if base in BASE_CLASSES), None)
+    if ats is None:
+        return None
+    site_name = _site_name(class_node)
+    if not site_name:
+        logger.warning(f"Skipping {module}.{class_node.name}: no literal site_name")
+        return None
+
+    attributes = {}
+    methods = set()
+    for item in class_node.body:
+        if isinstance(item, ast.Assign):
+            for target in item.targets:
+                if isinstance(target, ast.Name):
+                    attributes[target.id] = _literal(item.value)
+        elif isinstance(item, ast.FunctionDef):
+            methods.add(item.name)
+
+    if attributes.get('fetches_details') or ats == 'greenhouse':
+        cost = 'detail'
+    elif methods & {'iter_pages', 'iter_jobs'} or ats == 'workday':
+        cost = 'paged'
+    else:
+        cost = 'single'
+
+    return FetcherSpec(
+        site_name=site_name,
+        module=module,
+        class_name=class_node.name,
+        ats=ats,
+        cost=cost,
+        parse_in_pool=bool(attributes.get('parse_in_pool', False)),
+        enabled=attributes.get('enabled', True) is not False,
+        source=source,
+        tags=tuple(attributes.get('tags') or ())
+    )
+
+
+def scan_module(path: str, module: str, source: str = 'package',
+                class_name: Optional[str] = None) -> List[FetcherSpec]:
+    """Reads the fetcher classes defined in a module's source file (optionally only class_name)."""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    specs = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and (class_name is None or node.name == class_name):
+            spec = _spec_from_class(node, module, source)
+            if spec is not None:
+                specs.append(spec)
+    return specs
+
+
+def _entry_points() -> Iterable:
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group=ENTRY_POINT_GROUP)
+    return entry_points.get(ENTRY_POINT_GROUP, [])
+
+
+def _scan_entry_point(entry_point) -> List[FetcherSpec]:
+    module, _, class_name = entry_point.value.partition(':')
+    module, class_name = module.strip(), class_name.strip()
+    # find_spec locates the source without executing the module (parent packages are imported)
+    module_spec = importlib.util.find_spec(module)
+    if module_spec is not None and module_spec.origin and module_spec.origin.endswith('.py'):
+        specs = scan_module(module_spec.origin, module, 'entry_point', class_name)
+        if specs:
+            return specs
+    # No readable source: register with the entry point name as site name and default metadata
+    return [FetcherSpec(site_name=entry_point.name, module=module, class_name=class_name, source='entry_point')]
+
+
+def select_specs(specs: Iterable[FetcherSpec], sites: Iterable[str] = (),
+                 tags: Iterable[str] = ()) -> List[FetcherSpec]:
+    """
+    Returns the specs of the named sites plus those carrying any of the tags (see
+    FetcherSpec.all_tags, e.g. 'greenhouse'), every spec when neither is given.
+    Raises ValueError for unknown site names or tags.
+    """
+    specs = list(specs)
+    sites, tags = set(sites), {tag.lower() for tag in tags}
+    if not sites and not tags:
+        return specs
+    unknown = sites - {spec.site_name for spec in specs}
+    if unknown:
+        raise ValueError(f"Unknown sites: {', '.join(sorted(unknown))}")
+    known_tags = frozenset().union(*(spec.all_tags for spec in specs))
+    if tags - known_tags:
+        raise ValueError(f"Unknown tags: {', '.join(sorted(tags - known_tags))} "
+                         f"(available: {', '.join(sorted(known_tags))})")
+    return [spec for spec in specs if spec.site_name in sites or spec.all_tags & tags]
+
+
+class FetcherRegistry:
+    """Fetcher specs by site name, in discovery order (package modules by file name, then plugins)."""
+
+    def __init__(self, specs: Iterable[FetcherSpec]):
+        self.specs: Dict[str, FetcherSpec] = {}
+        for spec in specs:
+            if spec.site_name in self.specs:
+                logger.warning(f"Duplicate fetcher for {spec.site_name} in {spec.module}, keeping "
+                               f"{self.specs[spec.site_name].module}")
+                continue
+            self.specs[spec.site_name] = spec
+
+    @classmethod
+    def discover(cls, package_dir: Optional[str] = None, package: str = 'fetchers',
+                 entry_points: bool = True) -> 'FetcherRegistry':
+        package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+        specs = []
+        for file_name in sorted(os.listdir(package_dir)):
+            if not file_name.endswith('_fetcher.py'):
+                continue
+            try:
+                specs.extend(scan_module(os.path.join(package_dir, file_name), f"{package}.{file_name[:-3]}"))
+            except (OSError, SyntaxError) as e:
+                logger.error(f"Failed to read fetcher module {file_name}: {str(e)}")
+
+        if entry_points:
+            for entry_point in _entry_points():
+                try:
+                    specs.extend(_scan_entry_point(entry_point))
+                except Exception as e:
+                    logger.error(f"Failed to read fetcher plugin {entry_point.name}: {str(e)}")
+        return cls(specs)
+
+    def __iter__(self):
+        return iter(self.specs.values())
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def get(self, site_name: str) -> Optional[FetcherSpec]:
+        return self.specs.get(site_name)
+
+    def enabled(self) -> List[FetcherSpec]:
+        return [spec for spec in self.specs.values() if spec.enabled]
+
+
+_registry: Optional[FetcherRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry(refresh: bool = False) -> FetcherRegistry:
+    """Returns the process-wide registry, discovered on first use (or again with refresh)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None or refresh:
+            _registry = FetcherRegistry.discover()
+        return _registry
@@ -1,41 +1,8 @@
-import requests
-import logging
-from datetime import datetime
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from .base_fetcher import BaseFetcher
-import re
+from .greenhouse import GreenhouseFetcher
 
-logger = logging.getLogger(__name__)
-
-class SchonfeldFetcher(BaseFetcher):
+class SchonfeldFetcher(GreenhouseFetcher):
     def __init__(self):
         super().__init__(
             site_name="Schonfeld",
-            url="https://boards-api.greenhouse.io/v1/boards/schonfeld/jobs?content=true"
+            boards=['schonfeld']
         )
-
-    def fetch_jobs(self) -> List[Dict[str, Any]]:
-        jobs = []
-        try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-
-            for job in data.get('jobs', []):
-                # Clean HTML content using BeautifulSoup
-                description = BeautifulSoup(job.get('content', ''), 'html.parser').get_text(separator='\n', strip=True)
-                description = re.sub(r'<[^>]+>', '', description)
-                
-                jobs.append({
-                    'title': job.get('title', ''),
-                    'description': description,
-                    'url': job.get('absolute_url', ''),
-                    'location': job.get('location', {}).get('name', 'Remote'),
-                    'posted_date': datetime.fromisoformat(job['first_published']) if job.get('first_published') else None
-                })
-
-        except Exception as e:
-            logger.error(f"Error fetching jobs from {self.site_name}: {str(e)}")
-        
-        return jobs
\ No newline at end of file
@@ -1,10 +1,8 @@
-import requests
-import re
-import json
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
+from .embedded_json import js_assignment
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +15,12 @@ class ScientechResearchCapitalFetcher(BaseFetcher):
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
+            self._check_listing(response.text)
 
             # Extract JSON data from script tag
-            script_content = re.search(r'window\.__appData\s*=\s*({.*?});', response.text, re.DOTALL)
-            if not script_content:
-                raise ValueError("Could not find window.__appData in page source")
-
-            data = json.loads(script_content.group(1))
+            data = js_assignment(response.text, 'window.__appData')
             job_board = data.get('jobBoard', {})
             jobs_data = job_board.get('jobPostings', [])
 
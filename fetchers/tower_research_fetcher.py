@@ -1,56 +1,58 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from bs4 import SoupStrainer
 from .base_fetcher import BaseFetcher
 
 logger = logging.getLogger(__name__)
 
 class TowerResearchFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(
             site_name="Tower Research",
             url="https://job-boards.greenhouse.io/embed/job_board?for=towerresearchcapital"
         )
 
-    def fetch_jobs(self) -> List[Dict[str, Any]]:
-        jobs = []
+    def iter_pages(self) -> Iterator[str]:
         try:
             # Get total pages
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._soup(response.content)
             
             pagination = soup.find('div', {'class': 'pagination-wrapper'})
             max_page = max(
                 [int(li.button.text.strip()) for li in pagination.ul.find_all('li') if li.button]
             ) if pagination else 1
 
-            # Iterate through pages
-            for page in range(1, max_page + 1):
-                page_url = f"{self.url}&page={page}"
-                page_response = requests.get(page_url, headers=self.headers, timeout=self.timeout)
-                page_response.raise_for_status()
-                page_soup = BeautifulSoup(page_response.content, 'html.parser')
-
-                # Process departments
-                for department in page_soup.find_all('div', {'class': 'job-posts--table--department'}):
-                    dept_name = department.h3.text.strip()
-                    
-                    for job in department.find_all('tr', {'class': 'job-post'}):
-                        link = job.find('a')
-                        title = link.find('p', {'class': 'body--medium'}).text.strip()
-                        location = link.find('p', {'class': 'body__secondary'}).text.strip()
-
-                        jobs.append({
-                            'title': title,
-                            'description': f"{dept_name}: {title}",
-                            'url': link['href'],
-                            'location': location,
-                            'posted_date': None
-                        })
+            # Fetch all pages concurrently, each page is yielded as soon as it arrives
+            for _, html in self._iter_pages(lambda page: f"{self.url}&page={page}", max_page):
+                yield html
 
         except Exception as e:
             logger.error(f"Error fetching jobs from {self.site_name}: {str(e)}")
-        
+            raise
+
+    def parse_page(self, content: str) -> List[Dict[str, Any]]:
+        jobs = []
+        # Only the department tables are built, not the rest of the page
+        page_soup = self._soup(content, SoupStrainer('div', class_='job-posts--table--department'))
+
+        # Process departments
+        for department in page_soup.find_all('div', {'class': 'job-posts--table--department'}):
+            dept_name = department.h3.text.strip()
+            
+            for job in department.find_all('tr', {'class': 'job-post'}):
+                link = job.find('a')
+                title = link.find('p', {'class': 'body--medium'}).text.strip()
+                location = link.find('p', {'class': 'body__secondary'}).text.strip()
+
+                jobs.append({
+                    'title': title,
+                    'description': f"{dept_name}: {title}",
+                    'url': link['href'],
+                    'location': location,
+                    'posted_date': None
+                })
         return jobs
\ No newline at end of file
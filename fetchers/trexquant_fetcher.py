@@ -1,4 +1,3 @@
-import requests
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
@@ -16,8 +15,9 @@ class TrexQuantFetcher(BaseFetcher):
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         jobs = []
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
+            self._check_listing(response.text)
             data = response.json()
 
             for job in data.get('jobs', []):
@@ -1,6 +1,4 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
 
@@ -16,9 +14,10 @@ class VeritionCapitalFetcher(BaseFetcher):
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         jobs = []
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            self._check_listing(response.text)
+            soup = self._soup(response.text)
             
             main_container = soup.select_one('div.job-posts')
             if not main_container:
@@ -1,20 +1,20 @@
-import requests
 import logging
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 from requests.exceptions import RequestException
 
 logger = logging.getLogger(__name__)
 
 class VikingGlobalFetcher(BaseFetcher):
+    parse_in_pool = True
+
     def __init__(self):
         super().__init__(site_name="Viking Global", url="https://job-boards.greenhouse.io/vikingglobalinvestors")
 
 
     def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
         """Parses HTML content to extract job listings for Viking Global."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         jobs = []
         job_tables = soup.find_all('div', class_='job-posts--table')
 
@@ -1,12 +1,12 @@
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 import logging
 
 logger = logging.getLogger(__name__)
 
 class WintonCapitalFetcher(BaseFetcher):
+    fetches_details = True
+
     def __init__(self):
         super().__init__(
             site_name="WintonCapital",
@@ -15,7 +15,7 @@ class WintonCapitalFetcher(BaseFetcher):
     
     def parse_jobs(self, html: str) -> list:
         jobs = []
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         
         # Find the main container
         main_element = soup.find('main', attrs={'role': 'main', 'class': 'relative'})
@@ -36,6 +36,7 @@ class WintonCapitalFetcher(BaseFetcher):
         # Find all job rows (div elements with py-10 class in their class list)
         job_rows = job_container.find_all('div', class_=lambda c: c and 'py-10' in c)
         
+        listings = []
         for job_row in job_rows:
             try:
                 # Extract job title from the first h4 element
@@ -54,50 +55,46 @@ class WintonCapitalFetcher(BaseFetcher):
                     logger.warning(f"No apply link found for job: {title}")
                     continue
                 
-                # Fetch job description from the detail page
-                description = self._fetch_job_description(apply_link)
-                
-                jobs.append({
-                    'title': title,
-                    'description': description,
-                    'source_site': self.site_name,
-                    'url': apply_link,
-                    'location': location,
-                    'posted_date': datetime.now()  # Use current date as posted date since not provided
-                })
+                listings.append((title, location, apply_link))
                 
             except Exception as e:
                 logger.error(f"Error parsing job row: {str(e)}")
+
+        # Fetch job descriptions from the detail pages concurrently, skipping jobs we already stored
+        details = self._fetch_details([apply_link for _, _, apply_link in listings], self._parse_job_description)
+
+        for title, location, apply_link in listings:
+            detail = details.get(apply_link)
+            jobs.append({
+                'title': title,
+                'description': detail['description'] if detail else '',
+                'source_site': self.site_name,
+                'url': apply_link,
+                'location': location,
+                'posted_date': datetime.now()  # Use current date as posted date since not provided
+            })
         
         return jobs
     
-    def _fetch_job_description(self, job_url: str) -> str:
-        """Fetch and parse the job description from the detail page"""
-        try:
-            response = requests.get(job_url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            detail_soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the main content element
-            main_element = detail_soup.find('main', attrs={'role': 'main', 'class': 'relative'})
-            if not main_element:
-                return "No description available"
-            
-            # Extract text from all paragraph elements
-            paragraphs = main_element.find_all('p')
-            paragraph_texts = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
-            
-            # Extract text from all list items
-            list_items = main_element.find_all('li')
-            list_item_texts = [f"• {li.get_text(strip=True)}" for li in list_items if li.get_text(strip=True)]
-            
-            # Combine all text elements
-            all_texts = paragraph_texts + list_item_texts
-            description = "\n\n".join(all_texts)
-            
-            return description if description else "No description available"
-            
-        except Exception as e:
-            logger.error(f"Error fetching job description from {job_url}: {str(e)}")
-            return f"Error fetching description: {str(e)}"
\ No newline at end of file
+    def _parse_job_description(self, html: str) -> dict:
+        """Parse the job description from the detail page"""
+        detail_soup = self._soup(html)
+        
+        # Find the main content element
+        main_element = detail_soup.find('main', attrs={'role': 'main', 'class': 'relative'})
+        if not main_element:
+            return {'description': "No description available"}
+        
+        # Extract text from all paragraph elements
+        paragraphs = main_element.find_all('p')
+        paragraph_texts = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
+        
+        # Extract text from all list items
+        list_items = main_element.find_all('li')
+        list_item_texts = [f"• {li.get_text(strip=True)}" for li in list_items if li.get_text(strip=True)]
+        
+        # Combine all text elements
+        all_texts = paragraph_texts + list_item_texts
+        description = "\n\n".join(all_texts)
+        
+        return {'description': description if description else "No description available"}
\ No newline at end of file
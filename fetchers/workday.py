@@ -0,0 +1,180 @@
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from .base_fetcher import BaseFetcher
+from .http_session import new_session
+from .politeness import bind_run_budget
+
+logger = logging.getLogger(__name__)
+
+CSRF_COOKIE = 'CALYPSO_CSRF_TOKEN'
+
+_RELATIVE_UNITS = {'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+
+def parse_posted_on(posted_on: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Converts Workday's relative postedOn text ("Posted Today", "Posted Yesterday",
+    "Posted 3 Days Ago", "Posted 30+ Days Ago", "Posted 2 Weeks Ago") into a UTC datetime.
+    Returns None for text it does not recognize.
+    """
+    if not posted_on:
+        return None
+    now = now or datetime.utcnow()
+    text = posted_on.lower()
+    if 'today' in text or 'just posted' in text:
+        return now
+    if 'yesterday' in text:
+        return now - timedelta(days=1)
+
+    match = re.search(r'(\d+)\+?\s*(day|week|month|year)', text)
+    if not match:
+        logger.warning(f"Could not parse date string: {posted_on}")
+        return None
+    return now - timedelta(days=int(match.group(1)) * _RELATIVE_UNITS[match.group(2)])
+
+
+class WorkdayFetcher(BaseFetcher):
+    """
+    Fetcher for Workday career sites through their cxs jobs API.
+    The first page reports the total, the remaining offsets are then requested
+    concurrently. Tenants that require a CSRF token get a bootstrapped session that is
+    reused across runs until the token expires (or the API rejects it).
+    Subclasses may override _build_description.
+    """
+    page_size = 20
+    # Upper bound for reusing a CSRF session when the cookie carries no expiry
+    csrf_ttl = timedelta(minutes=30)
+
+    # careers_url -> (session, csrf token, expiry), shared by every instance in the process
+    _csrf_sessions: Dict[str, Tuple[requests.Session, str, datetime]] = {}
+    _csrf_lock = threading.Lock()
+
+    def __init__(self, site_name: str, url: str, careers_url: str, job_base_url: str,
+                 requires_csrf: bool = True):
+        super().__init__(site_name=site_name, url=url)
+        self.careers_url = careers_url
+        self.job_base_url = job_base_url
+        self.requires_csrf = requires_csrf
+
+    def _csrf_session(self, refresh: bool = False) -> Tuple[requests.Session, str]:
+        """Returns a session holding the tenant's CSRF cookie and the token, bootstrapping it when needed."""
+        with self._csrf_lock:
+            cached = self._csrf_sessions.get(self.careers_url)
+            if cached and not refresh and cached[2] > datetime.utcnow():
+                return cached[0], cached[1]
+
+            # Own cookie jar, shared connection pool
+            session = new_session()
+            response = session.get(
+                self.careers_url,
+                headers={
+                    **self.headers,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Cache-Control': 'no-cache'
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+
+            cookie = next((c for c in session.cookies if c.name == CSRF_COOKIE), None)
+            if cookie is None or not cookie.value:
+                raise ValueError("CSRF token cookie not received in initial response")
+
+            expires = datetime.utcnow() + self.csrf_ttl
+            if cookie.expires:
+                expires = min(expires, datetime.utcfromtimestamp(cookie.expires))
+            self._csrf_sessions[self.careers_url] = (session, cookie.value, expires)
+            logger.info(f"Bootstrapped Workday session for {self.site_name}, valid until {expires}")
+            return session, cookie.value
+
+    def _api_session(self, refresh: bool = False) -> Tuple[requests.Session, Dict[str, str]]:
+        headers = {
+            **self.headers,
+            'Accept': 'application/json',
+            'Accept-Language': 'en-US',
+            'Content-Type': 'application/json',
+            'Origin': re.match(r'https?://[^/]+', self.careers_url).group(0),
+            'Referer': self.careers_url
+        }
+        if not self.requires_csrf:
+            return self.session, headers
+
+        session, token = self._csrf_session(refresh)
+        headers['X-Calypso-CSRF-Token'] = token
+        return session, headers
+
+    def _post_page(self, session: requests.Session, headers: Dict[str, str], offset: int) -> Dict[str, Any]:
+        response = session.post(
+            self.url,
+            headers=headers,
+            json={
+                "appliedFacets": {},
+                "limit": self.page_size,
+                "offset": offset,
+                "searchText": ""
+            },
+            timeout=self.timeout
+        )
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise RuntimeError(
+                f"API request failed: {e.response.status_code} {e.response.reason}\n"
+                f"Response body: {e.response.text[:500]}"
+            ) from e
+        return response.json()
+
+    def _fetch_postings(self) -> List[Dict[str, Any]]:
+        """Fetches every job posting: the first page for the total, then the remaining pages concurrently."""
+        session, headers = self._api_session()
+        try:
+            first_page = self._post_page(session, headers, 0)
+        except RuntimeError:
+            if not self.requires_csrf:
+                raise
+            # The cached token may have been revoked early, bootstrap a new one once
+            session, headers = self._api_session(refresh=True)
+            first_page = self._post_page(session, headers, 0)
+
+        # Only the first page reports the total
+        total = first_page.get('total', 0)
+        offsets = list(range(self.page_size, total, self.page_size))
+        pages = [first_page]
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(self.page_concurrency, len(offsets))) as executor:
+                pages.extend(executor.map(bind_run_budget(lambda offset: self._post_page(session, headers, offset)),
+                                          offsets))
+
+        logger.info(f"{self.site_name}: {total} jobs in {len(pages)} pages")
+        return [posting for page in pages for posting in page.get('jobPostings', [])]
+
+    def fetch_jobs(self) -> List[Dict[str, Any]]:
+        start = time.monotonic()
+        postings = self._fetch_postings()
+        self._check_listing(json.dumps(postings, sort_keys=True))
+
+        jobs = []
+        for posting in postings:
+            try:
+                jobs.append({
+                    'title': posting.get('title', ''),
+                    'description': self._build_description(posting),
+                    'url': f"{self.job_base_url}{posting.get('externalPath', '')}",
+                    'location': posting.get('locationsText', ''),
+                    'posted_date': parse_posted_on(posting.get('postedOn'))
+                })
+            except Exception as e:
+                logger.warning(f"Error processing job from {self.site_name}: {str(e)}")
+
+        logger.info(f"Fetched {len(jobs)} jobs from {self.site_name} in {time.monotonic() - start:.1f}s")
+        return jobs
+
+    def _build_description(self, posting: Dict[str, Any]) -> str:
+        return ', '.join(posting.get('bulletFields', []))
@@ -1,6 +1,4 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 from .base_fetcher import BaseFetcher
 
@@ -14,9 +12,10 @@ class WorldQuantFetcher(BaseFetcher):
         )
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
-        response = requests.get(self.url, headers=self.headers, timeout=self.timeout)
+        response = self.session.get(self.url, headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        self._check_listing(response.text)
+        soup = self._soup(response.text)
 
         jobs = []
         careers_list = soup.find('ul', {'id': 'careers_list', 'class': 'cg-list'})
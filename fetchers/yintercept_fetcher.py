@@ -1,7 +1,5 @@
-import requests
 from datetime import datetime
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base_fetcher import BaseFetcher
 import logging
 
@@ -16,10 +14,11 @@ class YInterceptFetcher(BaseFetcher):
 
     def fetch_jobs(self) -> List[Dict[str, Any]]:
         html = self._get_html()
+        self._check_listing(html)
         return self.parse_jobs(html)
 
     def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         container = soup.find('div', class_='post-content')
         
         if not container:
@@ -1,8 +1,10 @@
 from datetime import datetime
+from sqlalchemy import inspect, text
 from extensions import db
 
 class Job(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    job_key = db.Column(db.String(500))  # Stable identity within a site: ATS job id or URL
     title = db.Column(db.String(200))
     description = db.Column(db.Text)
     source_site = db.Column(db.String(50))
@@ -10,6 +12,74 @@ class Job(db.Model):
     location = db.Column(db.String(100))
     posted_date = db.Column(db.DateTime)
     updated_time = db.Column(db.DateTime, default=datetime.utcnow)
-    
+    first_seen = db.Column(db.DateTime, default=datetime.utcnow)
+    closed_at = db.Column(db.DateTime)  # Set when the job disappears from the site's listing
+
+    __table_args__ = (
+        db.Index('ix_job_source_site_job_key', 'source_site', 'job_key'),
+        # Keyset pagination of the listing: open jobs (closed_at IS NULL) by (updated_time, id)
+        db.Index('ix_job_closed_at_updated_time_id', 'closed_at', 'updated_time', 'id'),
+    )
+
     def __repr__(self):
-        return f'<Job {self.title} from {self.source_site}>'
\ No newline at end of file
+        return f'<Job {self.title} from {self.source_site}>'
+
+class SiteFetchState(db.Model):
+    """Per-site fetch bookkeeping, one row per fetcher keyed by its site name."""
+    __tablename__ = 'site_fetch_state'
+
+    site_name = db.Column(db.String(50), primary_key=True)
+    last_attempt_at = db.Column(db.DateTime)
+    last_success_at = db.Column(db.DateTime)  # Start of the last successful fetch
+    last_duration = db.Column(db.Float)  # Seconds taken by the last attempt, fetch and store
+    mean_duration = db.Column(db.Float)  # Smoothed seconds per attempt, longest sites start first
+    job_count = db.Column(db.Integer)  # Jobs in the listing at the last success
+    listing_hash = db.Column(db.String(64))  # SHA-256 of the jobs stored at the last success
+    listing_fingerprint = db.Column(db.String(64))  # SHA-256 of the normalized raw listing at the last success
+    last_error = db.Column(db.Text)  # Error of the last attempt, None when it succeeded
+    last_changed_at = db.Column(db.DateTime)  # Last successful fetch that changed any job
+    change_rate = db.Column(db.Float)  # Smoothed share of fetches that found changes
+    refresh_interval = db.Column(db.Float)  # Seconds between fetches learned by the refresh policy
+    next_fetch_at = db.Column(db.DateTime)
+    consecutive_failures = db.Column(db.Integer, default=0)  # Failed attempts since the last success
+    opened_at = db.Column(db.DateTime)  # When the circuit breaker last opened, None while closed
+
+    def to_dict(self):
+        data = {}
+        for column in self.__table__.columns:
+            value = getattr(self, column.name)
+            data[column.name] = value.isoformat() if isinstance(value, datetime) else value
+        return data
+
+    def __repr__(self):
+        return f'<SiteFetchState {self.site_name} next at {self.next_fetch_at}>'
+
+# SQL expressions used to populate a column when upgrade_schema adds it to an existing table
+COLUMN_BACKFILLS = {
+    ('job', 'job_key'): 'url',
+    ('job', 'first_seen'): 'updated_time',
+}
+
+def upgrade_schema():
+    """
+    db.create_all() only creates missing tables. Adds the columns and indexes
+    introduced since an existing database was created, so old jobs.db files keep working.
+    """
+    inspector = inspect(db.engine)
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                backfill = COLUMN_BACKFILLS.get((table.name, column.name))
+                if backfill:
+                    conn.execute(text(f'UPDATE {table.name} SET {column.name} = {backfill}'))
+
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
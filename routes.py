@@ -1,6 +1,38 @@
-from flask import render_template, request, redirect, url_for, flash, send_file
-from models import Job
+from flask import render_template, request, redirect, url_for, flash, send_file, Response, stream_with_context, jsonify
+from models import Job, SiteFetchState
 from extensions import db
+from services.search import apply_search
+from services.pagination import keyset_page
+from services.export import EXPORT_FORMATS, build_xlsx, stream_csv, stream_ndjson
+from services.scheduler import get_scheduler
+
+def filtered_jobs_query(source_site: str, search_term: str, location: str):
+    """
+    Builds the open-jobs query shared by the listing and the export.
+    Search terms go through the full-text index; matches are ordered by relevance.
+    Returns the unordered query with the column it is sorted by and whether the sort is descending,
+    ties are broken by Job.id in the same direction.
+    """
+    query = Job.query.filter(Job.closed_at.is_(None))
+
+    if source_site:
+        query = query.filter(Job.source_site == source_site)
+    if location:
+        query = query.filter(Job.location.contains(location))
+
+    rank = None
+    if search_term:
+        query, rank = apply_search(query, search_term)
+
+    if rank is not None:
+        return query, rank, False
+    return query, Job.updated_time, True
+
+def page_size_arg(app) -> int:
+    """Page size from the query string, bounded by JOBS_MAX_PAGE_SIZE."""
+    default = app.config.get('JOBS_PAGE_SIZE', 50)
+    page_size = request.args.get('page_size', default, type=int)
+    return max(1, min(page_size, app.config.get('JOBS_MAX_PAGE_SIZE', 500)))
 
 def register_routes(app):
     @app.route('/export-jobs')
@@ -8,45 +40,38 @@ def register_routes(app):
         source_site = request.args.get('source_site', '')
         search_term = request.args.get('search_term', '')
         location = request.args.get('location', '')
+        export_format = request.args.get('format', 'xlsx')
 
-        query = Job.query
-        
-        if source_site:
-            query = query.filter(Job.source_site == source_site)
-        if search_term:
-            query = query.filter(Job.title.contains(search_term) | Job.description.contains(search_term))
-        if location:
-            query = query.filter(Job.location.contains(location))
+        if export_format not in EXPORT_FORMATS:
+            flash(f'Unsupported export format: {export_format}', 'error')
+            return redirect(url_for('index'))
 
-        jobs = query.order_by(Job.updated_time.desc()).all()
+        query, sort_column, descending = filtered_jobs_query(source_site, search_term, location)
+        if descending:
+            query = query.order_by(sort_column.desc(), Job.id.desc())
+        else:
+            query = query.order_by(sort_column, Job.id)
 
-        if not jobs:
+        if query.first() is None:
             flash('No jobs to export', 'warning')
             return redirect(url_for('index'))
 
+        mimetype, download_name = EXPORT_FORMATS[export_format]
         try:
-            import pandas as pd
-            from io import BytesIO
-
-            df = pd.DataFrame([{
-                'Title': job.title,
-                'Description': job.description,
-                'Source Site': job.source_site,
-                'Posted Date': job.posted_date.strftime('%Y-%m-%d') if job.posted_date else '',
-                'Last Updated': job.updated_time.strftime('%Y-%m-%d %H:%M'),
-                'URL': job.url,
-                'Location': job.location
-            } for job in jobs])
-
-            output = BytesIO()
-            df.to_excel(output, index=False, engine='openpyxl')
-            output.seek(0)
-
-            return send_file(
-                output,
-                mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                download_name='jobs_export.xlsx',
-                as_attachment=True
+            if export_format == 'xlsx':
+                return send_file(
+                    build_xlsx(query),
+                    mimetype=mimetype,
+                    download_name=download_name,
+                    as_attachment=True
+                )
+
+            # CSV and NDJSON are generated while the response is sent, rows are read in chunks
+            stream = stream_csv(query) if export_format == 'csv' else stream_ndjson(query)
+            return Response(
+                stream_with_context(stream),
+                mimetype=mimetype,
+                headers={'Content-Disposition': f'attachment; filename={download_name}'}
             )
         except Exception as e:
             app.logger.error(f"Export failed: {str(e)}")
@@ -59,57 +84,92 @@ def register_routes(app):
         search_term = request.args.get('search_term', '')
         location = request.args.get('location', '')
         
-        query = Job.query
-        
-        if source_site:
-            query = query.filter(Job.source_site == source_site)
-            
-        if search_term:
-            query = query.filter(Job.title.contains(search_term) | Job.description.contains(search_term))
-        if location:
-            query = query.filter(Job.location.contains(location))
-        
-        jobs = query.order_by(Job.updated_time.desc()).all()
+        page_size = page_size_arg(app)
+
+        query, sort_column, descending = filtered_jobs_query(source_site, search_term, location)
+        page = keyset_page(query, sort_column, descending,
+                           cursor=request.args.get('cursor'),
+                           direction=request.args.get('direction', 'next'),
+                           page_size=page_size)
         source_sites = [site[0] for site in db.session.query(Job.source_site).distinct().all() if site[0]]
+
+        # Pagination links keep the current filters and only swap the cursor
+        link_args = {key: value for key, value in request.args.items()
+                     if key not in ('cursor', 'direction') and value}
+        next_url = url_for('index', **link_args, cursor=page.next_cursor) if page.next_cursor else None
+        prev_url = url_for('index', **link_args, cursor=page.prev_cursor, direction='prev') if page.prev_cursor else None
         
         return render_template('index.html', 
-                             jobs=jobs, 
+                             jobs=page.items, 
                              source_sites=source_sites,
+                             next_url=next_url,
+                             prev_url=prev_url,
+                             latest_run=get_scheduler(app).latest_run,
                              filters={
                                   'source_site': source_site,
                                   'search_term': search_term,
+                                  'location': location,
                                   'date_from': '',
                                   'date_to': ''
                               })
     
     @app.route('/fetch-jobs', methods=['POST'])
     def fetch_jobs():
+        wants_json = request.accept_mimetypes.best == 'application/json'
         try:
-            from services.fetcher_manager import FetcherManager
-            
-            fetcher_manager = FetcherManager(app)
-            result = fetcher_manager.fetch_all_jobs()
-            
-            # Display success/failure messages
-            if result['success']:
-                flash(f"Successfully fetched jobs from: {', '.join(result['success'])}", 'success')
-            
-            if result['failed']:
-                for site, error in result['failed'].items():
-                    flash(f"Failed to fetch from {site}: {error}", 'error')
-                    
+            # Optional selection: repeated site/tag form or query fields, or a JSON body with
+            # sites/tags lists, plus force (ignore the refresh schedule) and lane (bulk/priority)
+            body = request.get_json(silent=True) or {}
+            sites = body.get('sites') or request.values.getlist('site')
+            tags = body.get('tags') or request.values.getlist('tag')
+            force = body.get('force', request.values.get('force', '').lower() in ('1', 'true', 'on'))
+            lane = body.get('lane') or request.values.get('lane') or None
+
+            # Runs in the background; a click during an active run joins it instead of starting another
+            run = get_scheduler(app).trigger('manual', sites, tags, force, lane)
+            if wants_json:
+                return jsonify(run.summary()), 202
+            flash(f"Fetching jobs in the background (run #{run.id})", 'info')
+
+        except ValueError as e:
+            if wants_json:
+                return jsonify({'error': str(e)}), 400
+            flash(str(e), 'error')
         except Exception as e:
             # Add missing logger reference
             app.logger.error(f"Error in fetch_jobs route: {str(e)}")
             flash(f"An error occurred: {str(e)}", 'error')
             
         return redirect(url_for('index'))
+
+    @app.route('/runs/<int:run_id>')
+    def run_status(run_id):
+        run = get_scheduler(app).get_run(run_id)
+        if run is None:
+            return jsonify({'error': f'Run {run_id} not found'}), 404
+        return jsonify(run.to_dict())
+
+    @app.route('/runs/<int:run_id>/events')
+    def run_events(run_id):
+        run = get_scheduler(app).get_run(run_id)
+        if run is None:
+            return jsonify({'error': f'Run {run_id} not found'}), 404
+        return Response(run.stream(), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
     
+    @app.route('/sites')
+    def site_states():
+        states = SiteFetchState.query.order_by(SiteFetchState.site_name).all()
+        return jsonify([state.to_dict() for state in states])
+
     @app.route('/delete-jobs', methods=['POST'])
     def delete_jobs():
         try:
             # Delete all jobs
             rows_deleted = Job.query.delete()
+            # Without stored jobs, unchanged listings must be parsed again and every site is due
+            SiteFetchState.query.update({SiteFetchState.listing_fingerprint: None,
+                                         SiteFetchState.next_fetch_at: None})
             db.session.commit()
             
             if rows_deleted > 0:
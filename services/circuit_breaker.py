@@ -0,0 +1,60 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from models import SiteFetchState
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Stops fetching sites that keep failing (e.g. after a markup change), so they don't hold
+    a fetch slot through timeouts and retries on every run. After threshold consecutive
+    failures the site's circuit opens and runs skip it. Once cooldown has passed since it
+    opened, the next run sends one probe (half-open): a success closes the circuit, a failure
+    opens it for another cooldown. State lives in site_fetch_state, so it survives restarts.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, threshold: int, cooldown: timedelta):
+        self.threshold = threshold
+        self.cooldown = cooldown
+
+    @classmethod
+    def from_config(cls, config) -> 'CircuitBreaker':
+        # A threshold of 0 never opens circuits
+        return cls(
+            threshold=config.get('CIRCUIT_FAILURE_THRESHOLD', 5),
+            cooldown=timedelta(minutes=config.get('CIRCUIT_COOLDOWN_MINUTES', 60)),
+        )
+
+    def status(self, state: Optional[SiteFetchState], now: datetime) -> str:
+        if state is None or state.opened_at is None:
+            return self.CLOSED
+        return self.HALF_OPEN if now >= self.probe_at(state) else self.OPEN
+
+    def probe_at(self, state: SiteFetchState) -> datetime:
+        """When an open circuit lets the next probe through."""
+        return state.opened_at + self.cooldown
+
+    def allows(self, state: Optional[SiteFetchState], now: datetime) -> bool:
+        """Whether the site may be fetched: its circuit is closed, or half-open for a probe."""
+        return self.status(state, now) != self.OPEN
+
+    def record_success(self, state: SiteFetchState) -> None:
+        if state.opened_at is not None:
+            logger.info(f"Circuit of {state.site_name} closed after a successful probe")
+        state.consecutive_failures = 0
+        state.opened_at = None
+
+    def record_failure(self, state: SiteFetchState, now: datetime) -> None:
+        """Counts the failure and opens the circuit at the threshold; a failed probe reopens it."""
+        state.consecutive_failures = (state.consecutive_failures or 0) + 1
+        if self.threshold and state.consecutive_failures >= self.threshold:
+            if state.opened_at is None:
+                logger.warning(f"Circuit of {state.site_name} opened after "
+                               f"{state.consecutive_failures} consecutive failures")
+            state.opened_at = now
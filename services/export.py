@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+import tempfile
+from typing import Any, Callable, Iterator, List, Tuple
+
+EXPORT_CHUNK_SIZE = 1000  # Rows loaded from the database per round trip
+
+
+def _format_date(value, fmt: str) -> str:
+    return value.strftime(fmt) if value else ''
+
+
+# (header, value) pairs shared by every export format
+EXPORT_COLUMNS: List[Tuple[str, Callable[[Any], Any]]] = [
+    ('Title', lambda job: job.title),
+    ('Description', lambda job: job.description),
+    ('Source Site', lambda job: job.source_site),
+    ('Posted Date', lambda job: _format_date(job.posted_date, '%Y-%m-%d')),
+    ('First Seen', lambda job: _format_date(job.first_seen, '%Y-%m-%d %H:%M')),
+    ('Last Updated', lambda job: _format_date(job.updated_time, '%Y-%m-%d %H:%M')),
+    ('URL', lambda job: job.url),
+    ('Location', lambda job: job.location),
+]
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'jobs_export.csv'),
+    'ndjson': ('application/x-ndjson', 'jobs_export.ndjson'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'jobs_export.xlsx'),
+}
+
+
+def iter_rows(query, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[Any]]:
+    """
+    Yields one list of column values per job. yield_per streams the result in chunks
+    and lets finished chunks be garbage collected, so memory does not grow with the export.
+    """
+    for job in query.yield_per(chunk_size):
+        yield [value(job) for _, value in EXPORT_COLUMNS]
+
+
+def stream_csv(query, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """Yields the CSV export in pieces of roughly chunk_size rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+
+    for count, row in enumerate(iter_rows(query, chunk_size), start=1):
+        writer.writerow(row)
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_ndjson(query, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """Yields one JSON object per line, keyed by the export column headers."""
+    headers = [header for header, _ in EXPORT_COLUMNS]
+    lines = []
+    for row in iter_rows(query, chunk_size):
+        lines.append(json.dumps(dict(zip(headers, row)), ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def build_xlsx(query, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Writes the XLSX export with openpyxl's write-only mode, which flushes rows to disk
+    as they are appended instead of keeping the worksheet in memory.
+    Returns a temporary file positioned at the start; it is deleted once closed.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Jobs')
+    sheet.append([header for header, _ in EXPORT_COLUMNS])
+    for row in iter_rows(query, chunk_size):
+        sheet.append(row)
+
+    output = tempfile.TemporaryFile()
+    workbook.save(output)
+    output.seek(0)
+    return output
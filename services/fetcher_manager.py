@@ -1,199 +1,688 @@
 import logging
+import asyncio
+import hashlib
+import json
+import threading
+import time
 import concurrent.futures
-from typing import Dict, List, Any, Union, Tuple, Optional
+import functools
+import multiprocessing
+import os
+import aiohttp
+from collections import Counter
+from typing import Dict, List, Any, Union, Tuple, Optional, Callable, Iterable, Sequence, Set
 from datetime import datetime, timedelta
-from sqlalchemy import func
-from models import Job, db
+from sqlalchemy import select, insert, update, bindparam
+from models import Job, SiteFetchState, db
+from services.refresh_policy import RefreshPolicy
+from services.circuit_breaker import CircuitBreaker
+from fetchers.archive import configure_archive, get_archive
+from fetchers.html_parser import configure_parser, current_css_backend, current_parser
+from fetchers.politeness import configure_politeness, get_politeness
+from fetchers.base_fetcher import ListingUnchanged, parse_in_worker
+from fetchers.registry import FetcherSpec, get_registry, select_specs
 from flask import Flask
 
-# Import all fetchers (exclude demo fetchers for now)
-from fetchers.qube_rt_fetcher import QubeRTFetcher
-from fetchers.acadian_fetcher import AcadianAssetManagementFetcher
-from fetchers.northrock_fetcher import NorthRockFetcher
-from fetchers.quantedge_fetcher import QuantedgeFetcher
-from fetchers.lmr_partners_fetcher import LMRPartnersFetcher
-from fetchers.graham_capital_fetcher import GrahamCapitalFetcher
-from fetchers.winton_capital_fetcher import WintonCapitalFetcher
-from fetchers.aspect_capital_fetcher import AspectCapitalFetcher
-from fetchers.viking_global_fetcher import VikingGlobalFetcher
-from fetchers.susquehanna_investment_fetcher import SusquehannaInvestmentFetcher
-from fetchers.millennium_fetcher import MillenniumFetcher
-from fetchers.citadel_securities_fetcher import CitadelSecuritiesFetcher
-from fetchers.grasshope_fetcher import GrasshopeFetcher
-from fetchers.jane_street_fetcher import JaneStreetFetcher
-from fetchers.worldquant_fetcher import WorldQuantFetcher
-from fetchers.optiver_fetcher import OptiverFetcher
-from fetchers.tower_research_fetcher import TowerResearchFetcher
-from fetchers.rockbund_fetcher import RockBundFetcher
-from fetchers.trexquant_fetcher import TrexQuantFetcher
-from fetchers.jumptrading_fetcher import JumpTradingFetcher
-from fetchers.akuna_capital_fetcher import AkunaCapitalFetcher
-from fetchers.flow_trader_fetcher import FlowTraderFetcher
-from fetchers.eclipse_trading_fetcher import EclipseTradingFetcher
-from fetchers.balyansy_asset_management_fetcher import BalyansyAssetManagementFetcher
-from fetchers.manahl_fetcher import ManAHLFetcher
-from fetchers.verition_capital_fetcher import VeritionCapitalFetcher
-from fetchers.imc_trading_fetcher import IMCTradingFetcher
-from fetchers.engineersgate_fetcher import EngineersGateFetcher
-from fetchers.radix_trading_fetcher import RadixTradingFetcher
-from fetchers.panagora_fetcher import PanAgoraFetcher
-from fetchers.drw_fetcher import DRWFetcher
-from fetchers.deshaw_fetcher import DEShawFetcher
-from fetchers.schonfeld_fetcher import SchonfeldFetcher
-from fetchers.brevanhoward_fetcher import BrevanHowardFetcher
-from fetchers.yintercept_fetcher import YInterceptFetcher
-from fetchers.ap_capital_fetcher import APCapitalFetcher
-from fetchers.bluecrest_capital_fetcher import BlueCrestCapitalFetcher
-from fetchers.virtus_investment_fetcher import VirtusInvestmentPartnersFetcher
-from fetchers.hudson_river_trading_fetcher import HudsonRiverTradingFetcher
-from fetchers.point72_fetcher import Point72Fetcher
-from fetchers.two_sigma_fetcher import TwoSigmaFetcher
-from fetchers.bridgewater_fetcher import BridgewaterFetcher
-from fetchers.scientech_research_capital_fetcher import ScientechResearchCapitalFetcher
-from fetchers.alphagrep_fetcher import AlphagrepFetcher
-from fetchers.five_rings_fetcher import FiveRingsFetcher
-from fetchers.mako_fetcher import MakoFetcher
-from fetchers.maven_securities_fetcher import MavenSecuritiesFetcher
 
 logger = logging.getLogger(__name__)
 
+# Runs of different lanes may overlap in one process: SQLite allows a single writer,
+# and a site is only fetched by one run at a time
+_write_lock = threading.Lock()
+_active_sites: Set[str] = set()
+_active_sites_lock = threading.Lock()
+
+# Queue marker put by the iter_jobs producer thread once the listing is exhausted (or failed)
+_END_OF_LISTING = object()
+
+
+class SiteStore:
+    """
+    Incremental store of one site's listing, diffing fetched jobs against the stored rows.
+    add() writes new and changed jobs of each batch as it arrives; finish() closes the jobs
+    missing from the whole listing and records the fetch state. Callers provide the app
+    context and commit: FetcherManager._store_jobs runs all three steps in one transaction,
+    streamed fetches commit each batch so the SQLite write lock is not held across page loads.
+    Either way nothing is closed before the listing has been seen completely, so a fetch
+    that fails part-way only leaves the (valid) rows of the pages it did reach.
+    """
+
+    def __init__(self, manager: 'FetcherManager', site_name: str):
+        self.manager = manager
+        self.site_name = site_name
+        self.now = datetime.utcnow()
+        self.existing: Dict[str, Any] = {}
+        self.duplicates: List[Any] = []
+        # job key -> title of every job seen in the listing so far
+        self.seen: Dict[str, str] = {}
+        self.digests: List[str] = []
+        # url -> key of rows keyed by their URL, and the keys of those re-keyed to an ATS job id
+        self.url_keys: Dict[str, str] = {}
+        self.rekeyed: Set[str] = set()
+        self.stats = {'inserted': 0, 'updated': 0, 'closed': 0, 'unchanged': 0}
+
+    @property
+    def job_count(self) -> int:
+        return len(self.seen)
+
+    def load(self) -> None:
+        """Loads the site's stored rows, keyed by job key."""
+        table = Job.__table__
+        stored_rows = db.session.execute(
+            select(table.c.id, table.c.job_key, table.c.posted_date, table.c.closed_at,
+                   *(table.c[field] for field in self.manager.COMPARED_FIELDS))
+            .where(table.c.source_site == self.site_name)
+        )
+        for row in stored_rows.mappings():
+            if row['job_key'] in self.existing:
+                self.duplicates.append(row)
+            else:
+                self.existing[row['job_key']] = row
+                if row['url'] and row['job_key'] == row['url']:
+                    self.url_keys.setdefault(row['url'], row['job_key'])
+
+    def _adopt_url_keyed(self, key: str, url: Optional[str]) -> Optional[Any]:
+        """
+        Re-keys the row stored under the job's URL (before its fetcher provided ATS job ids,
+        e.g. Greenhouse sites) to key, so the job is updated instead of closed and inserted again.
+        """
+        url_key = self.url_keys.pop(url, None) if url else None
+        if url_key is None or url_key in self.seen or url_key not in self.existing:
+            return None
+        row = self.existing[key] = self.existing.pop(url_key)
+        self.rekeyed.add(key)
+        return row
+
+    def add(self, jobs: List[Dict[str, Any]]) -> None:
+        """Inserts the batch's new jobs and updates its changed ones."""
+        table = Job.__table__
+        compared_fields = self.manager.COMPARED_FIELDS
+        inserts, updates = [], []
+        for key, job_data in self.manager._keyed_jobs(jobs).items():
+            title = job_data.get('title', '')
+            if key in self.seen:
+                # A job shifted onto a later page while paging: already stored
+                if self.seen[key] == title:
+                    continue
+                # Otherwise another posting sharing the URL, like _keyed_jobs does within a batch
+                key = f"{key}#{title}"
+                if key in self.seen:
+                    continue
+            self.seen[key] = title
+            self.digests.append(self.manager._job_digest(key, job_data))
+
+            values = {field: job_data.get(field) for field in compared_fields}
+            row = self.existing.get(key)
+            if row is None and job_data.get('job_id'):
+                row = self._adopt_url_keyed(key, job_data.get('url'))
+            if row is None:
+                inserts.append({
+                    **values,
+                    'job_key': key,
+                    'source_site': self.site_name,  # Ensure consistency with fetcher site
+                    'posted_date': job_data.get('posted_date'),
+                    'updated_time': self.now,
+                    'first_seen': self.now
+                })
+                continue
+
+            # Many sites report the fetch time as posted date, keep the first one we saw
+            posted_date = row['posted_date'] if row['posted_date'] is not None else job_data.get('posted_date')
+            changed = (
+                any(row[field] != values[field] for field in compared_fields)
+                or posted_date != row['posted_date']
+                or row['closed_at'] is not None  # Job was re-listed
+                or key in self.rekeyed
+            )
+            if changed:
+                updates.append({**values, '_id': row['id'], 'job_key': key, 'posted_date': posted_date})
+            else:
+                self.stats['unchanged'] += 1
+
+        if inserts:
+            self.manager._execute_chunked(insert(table), inserts)
+        if updates:
+            self.manager._execute_chunked(
+                update(table)
+                .where(table.c.id == bindparam('_id'))
+                .values(updated_time=self.now, closed_at=None),
+                updates
+            )
+        self.stats['inserted'] += len(inserts)
+        self.stats['updated'] += len(updates)
+
+    def finish(self, started_at: Optional[datetime] = None, started: Optional[float] = None,
+               record_state: bool = True, listing_fingerprint: Optional[str] = None) -> Dict[str, int]:
+        """
+        Closes jobs missing from the listing and records the fetch state
+        (see FetcherManager._store_jobs for the arguments). Returns the per-operation counts.
+        """
+        table = Job.__table__
+        # Close jobs that disappeared from the listing, plus leftover duplicates of older imports
+        stale = [row for key, row in self.existing.items() if key not in self.seen] + self.duplicates
+        closed_ids = [row['id'] for row in stale if row['closed_at'] is None]
+        if closed_ids:
+            self.manager._execute_chunked(
+                update(table)
+                .where(table.c.id == bindparam('_id'))
+                .values(closed_at=self.now),
+                [{'_id': job_id} for job_id in closed_ids]
+            )
+        self.stats['closed'] = len(closed_ids)
+
+        # Record the attempt (also for empty listings) and schedule the next fetch
+        # from whether this one found any change
+        if record_state:
+            state = self.manager._get_state(self.site_name)
+            state.last_attempt_at = started_at or self.now
+            if started is not None:
+                self.manager._record_duration(state, time.monotonic() - started)
+            state.job_count = self.job_count
+            state.listing_hash = self.manager._listing_hash(self.digests)
+            # An empty listing may be a parse that swallowed an error: keep parsing until jobs come back
+            state.listing_fingerprint = listing_fingerprint if self.job_count else None
+            state.last_error = None
+            changed = self.stats['inserted'] + self.stats['updated'] + self.stats['closed'] > 0
+            self.manager.refresh_policy.record_success(state, changed, self.now, started_at)
+            self.manager.circuit_breaker.record_success(state)
+
+        logger.info(f"Stored jobs from {self.site_name}: {self.stats['inserted']} new, "
+                    f"{self.stats['updated']} updated, {self.stats['closed']} closed, "
+                    f"{self.stats['unchanged']} unchanged")
+        return dict(self.stats)
+
+
 class FetcherManager:
+    # Fields compared against the stored row to decide whether a job changed
+    COMPARED_FIELDS = ('title', 'description', 'url', 'location')
+    # Weight of the latest attempt in a site's mean_duration
+    DURATION_SMOOTHING = 0.3
+
     def __init__(self, app: Flask):
         self.app = app # Store the app instance
-        # Replace demo fetchers with real implementation
-        self.fetchers = [
-            QubeRTFetcher(),
-            AcadianAssetManagementFetcher(),
-            NorthRockFetcher(),
-            QuantedgeFetcher(),
-            LMRPartnersFetcher(),
-            GrahamCapitalFetcher(),
-            WintonCapitalFetcher(),
-            AspectCapitalFetcher(),
-            VikingGlobalFetcher(),
-            SusquehannaInvestmentFetcher(),
-            MillenniumFetcher(),
-            GrasshopeFetcher(),
-            CitadelSecuritiesFetcher(),
-            JaneStreetFetcher(),
-            WorldQuantFetcher(),
-            OptiverFetcher(),
-            TowerResearchFetcher(),
-            RockBundFetcher(),
-            TrexQuantFetcher(),
-            JumpTradingFetcher(),
-            AkunaCapitalFetcher(),
-            FlowTraderFetcher(),
-            EclipseTradingFetcher(),
-            BalyansyAssetManagementFetcher(),
-            ManAHLFetcher(),
-            VeritionCapitalFetcher(),
-            IMCTradingFetcher(),
-            EngineersGateFetcher(),
-            RadixTradingFetcher(),
-            PanAgoraFetcher(),
-            DRWFetcher(),
-            DEShawFetcher(),
-            SchonfeldFetcher(),
-            BrevanHowardFetcher(),
-            YInterceptFetcher(),
-            APCapitalFetcher(),
-            BlueCrestCapitalFetcher(),
-            VirtusInvestmentPartnersFetcher(),
-            HudsonRiverTradingFetcher(),
-            Point72Fetcher(),
-            TwoSigmaFetcher(),
-            BridgewaterFetcher(),
-            ScientechResearchCapitalFetcher(),
-            AlphagrepFetcher(),
-            FiveRingsFetcher(),
-            MakoFetcher(),
-            MavenSecuritiesFetcher()
-        ]
-        self.max_workers = 5 # Adjust the number of workers as needed
+        # Raw responses are kept so parser fixes can be replayed offline (flask reparse); full runs
+        # prune responses not fetched for RESPONSE_ARCHIVE_MAX_AGE_DAYS and superseded bodies (0 keeps all)
+        configure_archive(self.app.config.get('RESPONSE_ARCHIVE_DIR', 'response_archive'))
+        self.archive_max_age_days = self.app.config.get('RESPONSE_ARCHIVE_MAX_AGE_DAYS', 30)
+        # html.parser and bs4 unless faster ones are selected (HTML_PARSER: lxml/html.parser,
+        # CSS_BACKEND: selectolax/bs4), after checking them with benchmarks/bench_parsers.py
+        configure_parser(self.app.config.get('HTML_PARSER'), self.app.config.get('CSS_BACKEND'))
+        # Per-host rate/concurrency limits and the retry policy shared by every HTTP request
+        # (FETCH_HOST_RATE, FETCH_HOST_BURST, FETCH_HOST_CONCURRENCY, FETCH_MAX_RETRIES,
+        # FETCH_BACKOFF_BASE_SECONDS, FETCH_BACKOFF_MAX_SECONDS, FETCH_RETRY_BUDGET).
+        # Configured once per process (init_scheduler), runs of both lanes share the host limiters
+        configure_politeness(self.app.config, replace=False)
+        # Fetchers are discovered from their source (fetchers/*_fetcher.py and 'jd_fetcher.fetchers'
+        # entry points) and only imported and instantiated when a run schedules them
+        self.specs: List[FetcherSpec] = get_registry().enabled()
+        # Threads used by the adapter for synchronous fetchers and by DB work
+        self.max_workers = self.app.config.get('FETCH_MAX_WORKERS', 64)
+        # Sites fetched at once per run, started longest mean_duration first
+        self.site_concurrency = self.app.config.get('FETCH_SITE_CONCURRENCY', 16)
+        # Connection limits of the shared aiohttp session used by async fetchers
+        self.max_connections = self.app.config.get('FETCH_MAX_CONNECTIONS', 200)
+        self.max_connections_per_host = self.app.config.get('FETCH_MAX_CONNECTIONS_PER_HOST', 10)
+        # Rows per executemany batch when writing jobs
+        self.store_chunk_size = self.app.config.get('STORE_CHUNK_SIZE', 1000)
+        # Fetched batches buffered between a streaming fetcher and the store
+        self.stream_queue_size = self.app.config.get('STREAM_QUEUE_SIZE', 4)
+        # Processes parsing downloaded pages of parse_in_pool fetchers (0 parses in threads)
+        self.parse_workers = self.app.config.get('PARSE_WORKERS', os.cpu_count() or 1)
+        # Per-site refresh intervals learned from how often each listing changes
+        self.refresh_policy = RefreshPolicy.from_config(self.app.config)
+        # Skips sites after CIRCUIT_FAILURE_THRESHOLD consecutive failures, probing them again
+        # every CIRCUIT_COOLDOWN_MINUTES
+        self.circuit_breaker = CircuitBreaker.from_config(self.app.config)
+        # Called as on_progress(site_name, status, details) while a run progresses,
+        # status is one of 'running', 'skipped', 'unchanged', 'success' or 'failed'
+        self.on_progress: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
+        # Sites of the current run skipped because another run was fetching them
+        self._running_elsewhere: Set[str] = set()
+
+    @property
+    def site_names(self) -> List[str]:
+        return [spec.site_name for spec in self.specs]
+
+    def select(self, sites: Sequence[str] = (), tags: Sequence[str] = ()) -> List[FetcherSpec]:
+        """The specs of the named sites plus those carrying any of the tags, see select_specs."""
+        return select_specs(self.specs, sites, tags)
+
+    def _by_duration(self, specs: List[FetcherSpec]) -> List[FetcherSpec]:
+        """
+        Orders specs longest mean_duration first, so the slowest sites don't start last and
+        stretch the run (longest-processing-time scheduling). Sites never fetched go first.
+        """
+        with self.app.app_context():
+            durations = dict(db.session.query(SiteFetchState.site_name, SiteFetchState.mean_duration)
+                             .filter(SiteFetchState.site_name.in_([spec.site_name for spec in specs])))
+
+        def expected_duration(spec: FetcherSpec) -> float:
+            mean_duration = durations.get(spec.site_name)
+            return float('inf') if mean_duration is None else mean_duration
+
+        return sorted(specs, key=expected_duration, reverse=True)
+
+    def _report(self, site_name: str, status: str, **details) -> None:
+        if self.on_progress is None:
+            return
+        try:
+            self.on_progress(site_name, status, details)
+        except Exception as e:
+            logger.warning(f"Progress callback failed for {site_name}: {str(e)}")
     
-    def _fetch_and_store_job(self, fetcher) -> Tuple[str, Optional[str]]:
-        """Fetches and stores jobs for a single fetcher, handling app context."""
-        site_name = fetcher.site_name
+    def _due_state(self, site_name: str,
+                   force: bool = False) -> Tuple[Optional[str], Optional[str], Optional[datetime]]:
+        """
+        Returns why the site is skipped: 'circuit_open' while its circuit breaker is open,
+        'fresh' if the refresh policy has not scheduled its next fetch yet (force skips neither),
+        or None with its listing fingerprint and time of the last successful run.
+        A forced fetch gets no fingerprint, so it parses and stores even an unchanged listing.
+        """
+        now = datetime.utcnow()
+        with self.app.app_context():
+            state = db.session.get(SiteFetchState, site_name)
+            if not force:
+                if not self.circuit_breaker.allows(state, now):
+                    logger.info(f"Skipping {site_name} - circuit open after {state.consecutive_failures} "
+                                f"consecutive failures, next probe at {self.circuit_breaker.probe_at(state)}")
+                    return 'circuit_open', None, None
+                if not self.refresh_policy.is_due(state, now):
+                    logger.info(f"Skipping {site_name} - next fetch due at {state.next_fetch_at} "
+                                f"(interval {timedelta(seconds=round(state.refresh_interval))})")
+                    return 'fresh', None, None
+            if state is None:
+                return None, None, None
+            if self.circuit_breaker.status(state, now) == CircuitBreaker.HALF_OPEN:
+                logger.info(f"Probing {site_name} - circuit half-open")
+            return None, None if force else state.listing_fingerprint, state.last_success_at
+
+    @staticmethod
+    def _get_state(site_name: str) -> SiteFetchState:
+        """Returns the site's fetch state row, adding it to the session if the site is new."""
+        state = db.session.get(SiteFetchState, site_name)
+        if state is None:
+            state = SiteFetchState(site_name=site_name)
+            db.session.add(state)
+        return state
+
+    @classmethod
+    def _record_duration(cls, state: SiteFetchState, duration: float) -> None:
+        """Records the attempt's duration and folds it into the site's mean_duration."""
+        state.last_duration = duration
+        if state.mean_duration is None:
+            state.mean_duration = duration
+        else:
+            state.mean_duration = cls.DURATION_SMOOTHING * duration + (1 - cls.DURATION_SMOOTHING) * state.mean_duration
+
+    def _record_failure(self, site_name: str, error: str, started_at: datetime, duration: float) -> None:
+        """
+        Records a failed attempt. The next fetch stays due, so the site is retried on the next run
+        unless the failure opens its circuit breaker.
+        """
+        with _write_lock, self.app.app_context():
+            try:
+                state = self._get_state(site_name)
+                state.last_attempt_at = started_at
+                self._record_duration(state, duration)
+                state.last_error = error
+                self.circuit_breaker.record_failure(state, datetime.utcnow())
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error recording fetch failure for {site_name}: {str(e)}")
+
+    def _record_unchanged(self, site_name: str, started_at: datetime, duration: float) -> None:
+        """Records a fetch whose listing matched the previous run: a success without changes."""
+        now = datetime.utcnow()
+        with _write_lock, self.app.app_context():
+            try:
+                state = self._get_state(site_name)
+                state.last_attempt_at = started_at
+                self._record_duration(state, duration)
+                state.last_error = None
+                self.refresh_policy.record_success(state, False, now, started_at)
+                self.circuit_breaker.record_success(state)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error recording unchanged listing for {site_name}: {str(e)}")
+
+    def clear_listing_fingerprints(self, site_names: Iterable[str]) -> None:
+        """Makes the next fetch of the sites parse their listing even if the raw response is unchanged."""
+        with _write_lock, self.app.app_context():
+            try:
+                db.session.execute(update(SiteFetchState)
+                                   .where(SiteFetchState.site_name.in_(list(site_names)))
+                                   .values(listing_fingerprint=None))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+    def _load_known_jobs(self, site_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the stored jobs of a site keyed by URL and by job key (the ATS job id when
+        the fetcher provides one). Fetchers use them as a persistent description cache so
+        unchanged detail pages are not requested again.
+        Jobs without a description (failed detail fetches) are left out so they get retried.
+        """
+        with self.app.app_context():
+            rows = db.session.query(Job.url, Job.job_key, Job.title, Job.description, Job.location)\
+                .filter(Job.source_site == site_name, Job.description != '', Job.closed_at.is_(None))\
+                .all()
+        known_jobs = {}
+        for row in rows:
+            job = {'title': row.title, 'description': row.description, 'location': row.location}
+            for key in (row.url, row.job_key):
+                if key:
+                    known_jobs[key] = job
+        return known_jobs
+
+    async def _fetch_and_store_job(self, session: aiohttp.ClientSession, spec: FetcherSpec, store_lock: asyncio.Lock,
+                                   parse_pool: Optional[concurrent.futures.Executor] = None,
+                                   force: bool = False) -> Tuple[str, Optional[str]]:
+        """
+        Fetches and stores jobs for a single site on the event loop, importing its fetcher only if it is due
+        (or force). A site another run of this process is fetching is skipped.
+        """
+        site_name = spec.site_name
+        with _active_sites_lock:
+            if site_name in _active_sites:
+                logger.info(f"Skipping {site_name} - already being fetched by another run")
+                self._running_elsewhere.add(site_name)
+                self._report(site_name, 'skipped', reason='running')
+                return site_name, None
+            _active_sites.add(site_name)
         try:
-            # Use Flask app context for the entire fetch and store operation
-            with self.app.app_context():
-                # Check last update time
-                min_update = db.session.query(func.min(Job.updated_time))\
-                    .filter_by(source_site=site_name)\
-                    .scalar()
-
-                if min_update and (datetime.utcnow() - min_update) < timedelta(minutes=self.app.config.get('CACHE_THRESHOLD_MINUTES', 5)):
-                    logger.info(f"Skipping {site_name} - all records updated within threshold (oldest update {datetime.utcnow() - min_update} ago)")
-                    return site_name, None
-
-                logger.info(f"Starting job fetch from {site_name}")
-                jobs = fetcher.fetch_jobs()
-                self._store_jobs(site_name, jobs)
-                logger.info(f"Successfully fetched and stored {len(jobs)} jobs from {site_name}")
+            return await self._fetch_and_store_claimed(session, spec, store_lock, parse_pool, force)
+        finally:
+            with _active_sites_lock:
+                _active_sites.discard(site_name)
+
+    async def _fetch_and_store_claimed(self, session: aiohttp.ClientSession, spec: FetcherSpec,
+                                       store_lock: asyncio.Lock, parse_pool: Optional[concurrent.futures.Executor],
+                                       force: bool) -> Tuple[str, Optional[str]]:
+        site_name = spec.site_name
+        started_at = datetime.utcnow()
+        started = time.monotonic()
+        try:
+            skip_reason, listing_fingerprint, last_success_at = await asyncio.to_thread(
+                self._due_state, site_name, force)
+            if skip_reason:
+                self._report(site_name, 'skipped', reason=skip_reason)
+                return site_name, None
+
+            self._report(site_name, 'running')
+            fetcher = await asyncio.to_thread(spec.create)
+            fetcher.previous_listing_fingerprint = listing_fingerprint
+            fetcher.last_success_at = last_success_at
+
+            if fetcher.fetches_details:
+                fetcher.known_jobs = await asyncio.to_thread(self._load_known_jobs, site_name)
+
+            logger.info(f"Starting job fetch from {site_name}")
+            try:
+                if fetcher.streams_jobs:
+                    job_count, stats = await self._stream_and_store(fetcher, store_lock, started_at, started,
+                                                                    parse_pool)
+                else:
+                    jobs = await fetcher.fetch_jobs_async(session, parse_pool)
+                    job_count = len(jobs)
+                    # SQLite allows a single writer, serialize stores instead of failing on "database is locked"
+                    async with store_lock:
+                        stats = await asyncio.to_thread(self._store_jobs, site_name, jobs, started_at, started,
+                                                        listing_fingerprint=fetcher.listing_fingerprint)
+            except ListingUnchanged:
+                async with store_lock:
+                    await asyncio.to_thread(self._record_unchanged, site_name, started_at, time.monotonic() - started)
+                self._report(site_name, 'unchanged')
+                return site_name, None
+
+            logger.info(f"Successfully fetched and stored {job_count} jobs from {site_name}")
+            self._report(site_name, 'success', jobs=job_count, **stats)
             return site_name, None  # Return site name and no error
         except Exception as e:
             error_message = str(e)
-            # Log error outside the explicit context, relying on the outer context if needed
             logger.error(f"Error processing jobs from {site_name}: {error_message}", exc_info=True)
+            await asyncio.to_thread(self._record_failure, site_name, error_message,
+                                    started_at, time.monotonic() - started)
+            self._report(site_name, 'failed', error=error_message)
             return site_name, error_message # Return site name and error message
 
-    def fetch_all_jobs(self) -> Dict[str, Union[List[str], Dict[str, str]]]:
+    async def _stream_and_store(self, fetcher, store_lock: asyncio.Lock, started_at: datetime, started: float,
+                                parse_pool: Optional[concurrent.futures.Executor] = None) -> Tuple[int, Dict[str, int]]:
+        """
+        Stores the batches of a streaming fetcher (iter_jobs) while it is still loading later pages.
+        The iterator runs in a worker thread and hands batches over a queue bounded by
+        STREAM_QUEUE_SIZE, so a slow store holds the fetcher back instead of buffering the listing.
+        Paginated parse_in_pool fetchers only download in that thread: each page is sent to
+        parse_pool and its pending result queued, so pages are parsed in parallel, in page order per site.
+        Each batch is committed under store_lock; closing missing jobs and recording the fetch
+        state wait until the iterator is exhausted, an iterator error fails the site before that.
+        Returns (job count, per-operation counts).
+        """
+        loop = asyncio.get_running_loop()
+        batches: asyncio.Queue = asyncio.Queue(maxsize=self.stream_queue_size)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                if parse_pool is not None and fetcher.paginated and fetcher.parse_in_pool:
+                    items = (parse_pool.submit(parse_in_worker, type(fetcher), 'parse_page', content)
+                             for content in fetcher.iter_pages())
+                else:
+                    items = fetcher.iter_jobs()
+                for item in items:
+                    if stop.is_set():
+                        break
+                    asyncio.run_coroutine_threadsafe(batches.put(item), loop).result()
+            finally:
+                asyncio.run_coroutine_threadsafe(batches.put(_END_OF_LISTING), loop).result()
+
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        store = SiteStore(self, fetcher.site_name)
+        try:
+            await asyncio.to_thread(self._in_transaction, store.load)
+            while (item := await batches.get()) is not _END_OF_LISTING:
+                if isinstance(item, concurrent.futures.Future):
+                    batch = await asyncio.wrap_future(item)
+                else:
+                    batch = item
+                async with store_lock:
+                    await asyncio.to_thread(self._in_transaction, functools.partial(store.add, batch))
+        except Exception:
+            # Stop the producer and unblock its pending put before giving up on the site
+            stop.set()
+            while (item := await batches.get()) is not _END_OF_LISTING:
+                if isinstance(item, concurrent.futures.Future):
+                    item.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+
+        # Re-raises the fetch error (or ListingUnchanged) before anything is closed
+        await producer
+        async with store_lock:
+            stats = await asyncio.to_thread(
+                self._in_transaction,
+                functools.partial(store.finish, started_at, started,
+                                  listing_fingerprint=fetcher.listing_fingerprint)
+            )
+        return store.job_count, stats
+
+    def _in_transaction(self, step: Callable[[], Any]) -> Any:
+        """Runs step in an application context and commits it, rolling back on failure."""
+        with _write_lock, self.app.app_context():
+            try:
+                result = step()
+                db.session.commit()
+                return result
+            except Exception:
+                db.session.rollback()
+                raise
+
+    async def _fetch_all_jobs_async(self, specs: List[FetcherSpec], force: bool = False) -> List[Tuple[str, Optional[str]]]:
         """
-        Execute all registered fetchers in parallel and store results in database.
-        Returns a summary of successful and failed fetchers.
+        Runs the fetchers of specs, up to FETCH_SITE_CONCURRENCY at once in the given order,
+        and returns (site_name, error) pairs.
+        """
+        loop = asyncio.get_running_loop()
+        # Synchronous fetchers are adapted through asyncio.to_thread, size the pool so none of them queue
+        loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers))
+        # This run's own retry budget, inherited by its tasks and asyncio.to_thread calls
+        get_politeness().begin_run()
+
+        store_lock = asyncio.Lock()
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections_per_host)
+        # Waiters acquire in arrival order, so sites start in the order of specs
+        slots = asyncio.Semaphore(self.site_concurrency or len(specs) or 1)
+        parse_pool = self._create_parse_pool(specs)
+
+        async def run_site(session: aiohttp.ClientSession, spec: FetcherSpec) -> Tuple[str, Optional[str]]:
+            async with slots:
+                return await self._fetch_and_store_job(session, spec, store_lock, parse_pool, force)
+
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                return await asyncio.gather(*(run_site(session, spec) for spec in specs))
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+
+    def _create_parse_pool(self, specs: List[FetcherSpec]) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """
+        Process pool for the parse stage, owned by the run: HTTP stays on threads and the event loop,
+        CPU-bound parsing of parse_in_pool fetchers runs here without contending for the GIL.
+        Workers are spawned (not forked from this multi-threaded process) and use the same parsers.
+        """
+        if not self.parse_workers or not any(spec.parse_in_pool for spec in specs):
+            return None
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=configure_parser,
+            initargs=(current_parser(), current_css_backend())
+        )
+
+    def fetch_all_jobs(self, sites: Sequence[str] = (), tags: Sequence[str] = (),
+                       force: bool = False) -> Dict[str, Union[List[str], Dict[str, Any]]]:
+        """
+        Execute the registered fetchers concurrently on an asyncio event loop and store results in database.
+        sites/tags restrict the run (see select), force fetches sites the refresh policy would skip.
+        Sites start longest mean_duration first.
+        Returns a summary of successful and failed fetchers, the selected sites whose
+        circuit breaker is open after the run (skipped until their next probe), and the
+        sites skipped because another run was fetching them (running_elsewhere).
         """
         result = {
             "success": [],
-            "failed": {}
+            "failed": {},
+            "circuit_open": {},
+            "running_elsewhere": []
         }
-        
-        # Use ThreadPoolExecutor for parallel execution
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Map the fetcher processing function to each fetcher
-            future_to_fetcher = {executor.submit(self._fetch_and_store_job, fetcher): fetcher for fetcher in self.fetchers}
-            
-            for future in concurrent.futures.as_completed(future_to_fetcher):
-                site_name, error_message = future.result()
-                if error_message:
-                    result["failed"][site_name] = error_message
-                else:
-                    result["success"].append(site_name)
-                    
-        logger.info(f"Finished fetching all jobs. Success: {len(result['success'])}, Failed: {len(result['failed'])}")
+
+        self._running_elsewhere = set()
+        specs = self._by_duration(self.select(sites, tags))
+        run_results = asyncio.run(self._fetch_all_jobs_async(specs, force))
+        result["circuit_open"] = self._open_circuits([site_name for site_name, _ in run_results])
+        result["running_elsewhere"] = sorted(self._running_elsewhere)
+        for site_name, error_message in run_results:
+            if error_message:
+                result["failed"][site_name] = error_message
+            elif site_name not in result["circuit_open"] and site_name not in self._running_elsewhere:
+                result["success"].append(site_name)
+
+        logger.info(f"Finished fetching all jobs. Success: {len(result['success'])}, Failed: {len(result['failed'])}, "
+                    f"Circuit open: {len(result['circuit_open'])}, "
+                    f"Running elsewhere: {len(result['running_elsewhere'])}")
+        if not sites and not tags:
+            self._prune_archive()
         return result
-    
-    def _store_jobs(self, site_name: str, jobs: List[Dict[str, Any]]) -> None:
+
+    def _prune_archive(self) -> None:
+        archive = get_archive()
+        if archive is None or not self.archive_max_age_days:
+            return
+        try:
+            archive.prune(timedelta(days=self.archive_max_age_days))
+        except Exception as e:
+            logger.warning(f"Failed to prune the response archive: {str(e)}")
+
+    def _open_circuits(self, site_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Failure count, last error and next probe time of the sites whose circuit breaker is open."""
+        with self.app.app_context():
+            states = SiteFetchState.query.filter(SiteFetchState.site_name.in_(site_names),
+                                                 SiteFetchState.opened_at.isnot(None)).all()
+            return {
+                state.site_name: {
+                    'consecutive_failures': state.consecutive_failures,
+                    'opened_at': state.opened_at.isoformat(),
+                    'next_probe_at': self.circuit_breaker.probe_at(state).isoformat(),
+                    'last_error': state.last_error,
+                }
+                for state in states
+            }
+
+    @staticmethod
+    def _keyed_jobs(jobs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """
-        Store fetched jobs in the database. Replaces all existing jobs for this site.
-        Store fetched jobs in the database. Replaces all existing jobs for this site.
-        Uses SQLAlchemy session with atomic transaction.
+        Maps each fetched job to its stable identity: the ATS job id when the fetcher
+        provides one ('job_id'), otherwise the URL. Sites that share one URL between
+        postings fall back to URL + title.
+        """
+        def base_key(job_data):
+            return str(job_data.get('job_id') or job_data.get('url') or '')
+
+        counts = Counter(base_key(job_data) for job_data in jobs)
+        keyed = {}
+        for job_data in jobs:
+            key = base_key(job_data)
+            if not key or counts[key] > 1:
+                key = f"{key}#{job_data.get('title', '')}"
+            keyed[key] = job_data
+        return keyed
+
+    @classmethod
+    def _job_digest(cls, key: str, job_data: Dict[str, Any]) -> str:
+        """Digest of one keyed job over the stored fields."""
+        entry = [key, *(job_data.get(field) for field in cls.COMPARED_FIELDS)]
+        return hashlib.sha256(json.dumps(entry, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _listing_hash(digests: Iterable[str]) -> str:
+        """Fingerprint of a listing from its job digests, independent of job order."""
+        return hashlib.sha256(''.join(sorted(digests)).encode()).hexdigest()
+
+    def _execute_chunked(self, statement, rows: List[Dict[str, Any]]) -> None:
+        """Runs a Core statement as executemany batches, bypassing ORM unit-of-work bookkeeping."""
+        for start in range(0, len(rows), self.store_chunk_size):
+            db.session.execute(statement, rows[start:start + self.store_chunk_size])
+
+    def _store_jobs(self, site_name: str, jobs: List[Dict[str, Any]],
+                    started_at: Optional[datetime] = None, started: Optional[float] = None,
+                    record_state: bool = True, listing_fingerprint: Optional[str] = None) -> Dict[str, int]:
+        """
+        Store fetched jobs in the database incrementally, diffing against the stored rows:
+        new jobs are inserted, changed jobs updated, jobs missing from the listing are
+        marked closed and unchanged rows are not written at all.
+        Writes go through chunked Core executemany statements in one transaction,
+        together with the site's fetch state (started_at/started mark when the attempt began,
+        listing_fingerprint is the raw listing's fingerprint for the next run's short-circuit;
+        record_state=False leaves the state alone, e.g. for offline re-parses).
+        Returns the per-operation counts.
         """
         # Ensure database operations run within an application context
-        with self.app.app_context():
+        with _write_lock, self.app.app_context():
             try:
-                # Delete all existing jobs for this site first
-                delete_count = Job.query.filter_by(source_site=site_name).delete()
-                logger.info(f"Cleared {delete_count} existing jobs for {site_name}")
-                
-                # Add all new jobs
-                for job_data in jobs:
-                    new_job = Job(
-                        title=job_data['title'],
-                        description=job_data['description'],
-                        source_site=site_name,  # Ensure consistency with fetcher site
-                        url=job_data['url'],
-                        location=job_data['location'],
-                        posted_date=job_data['posted_date'],
-                        updated_time=datetime.utcnow()
-                    )
-                    db.session.add(new_job)
-                
+                store = SiteStore(self, site_name)
+                store.load()
+                store.add(jobs)
+                stats = store.finish(started_at, started, record_state, listing_fingerprint)
+
                 # Commit the transaction
                 db.session.commit()
-                logger.info(f"Successfully stored {len(jobs)} new jobs from {site_name}")
+                return stats
 
             except Exception as e:
                 db.session.rollback()
                 logger.error(f"Error storing jobs from {site_name}: {str(e)}")
-                raise
\ No newline at end of file
+                raise
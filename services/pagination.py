@@ -0,0 +1,70 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import tuple_
+from models import Job
+
+
+@dataclass
+class Page:
+    items: List[Any]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def encode_cursor(sort_value: Any, job_id: int) -> str:
+    """Encodes the (sort value, id) keyset position of a row as an opaque URL-safe token."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, job_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_column) -> Optional[Tuple[Any, int]]:
+    """Returns the (sort value, id) pair of a cursor, or None if it is malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        if sort_column is Job.updated_time:
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, int(job_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def keyset_page(query, sort_column, descending: bool, cursor: Optional[str] = None,
+                direction: str = 'next', page_size: int = 50) -> Page:
+    """
+    Returns one page of Job rows ordered by (sort_column, Job.id) using keyset pagination:
+    the cursor carries the position of the last (or first, for direction='prev') row seen,
+    so each page is an index range scan whose cost does not depend on how deep it is.
+    """
+    position = decode_cursor(cursor, sort_column) if cursor else None
+    backwards = position is not None and direction == 'prev'
+    # Walking backwards flips the order; the rows are reversed again below
+    reverse = descending != backwards
+
+    key = tuple_(sort_column, Job.id)
+    if position is not None:
+        bound = tuple_(*position)
+        query = query.filter(key < bound if reverse else key > bound)
+
+    order = (sort_column.desc(), Job.id.desc()) if reverse else (sort_column.asc(), Job.id.asc())
+    rows = query.add_columns(sort_column).order_by(None).order_by(*order).limit(page_size + 1).all()
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    items = [row[0] for row in rows]
+    if not rows:
+        return Page(items=items, next_cursor=None, prev_cursor=None)
+
+    first = encode_cursor(rows[0][1], rows[0][0].id)
+    last = encode_cursor(rows[-1][1], rows[-1][0].id)
+    if backwards:
+        return Page(items=items, next_cursor=last, prev_cursor=first if has_more else None)
+    return Page(items=items, next_cursor=last if has_more else None, prev_cursor=first if position else None)
@@ -0,0 +1,67 @@
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+from models import SiteFetchState
+
+
+class RefreshPolicy:
+    """
+    Learns how often each site should be fetched from how often its listing changes.
+    A fetch that finds changes shortens the site's interval, one that finds none
+    lengthens it (multiplicative increase/decrease, bounded by min and max).
+    The next fetch time is jittered so sites learned to the same interval spread out.
+    """
+
+    def __init__(self, min_interval: timedelta, max_interval: timedelta, jitter: float = 0.1,
+                 increase: float = 1.5, decrease: float = 0.5, smoothing: float = 0.3):
+        self.min_interval = min_interval.total_seconds()
+        self.max_interval = max(max_interval.total_seconds(), self.min_interval)
+        self.jitter = jitter
+        self.increase = increase
+        self.decrease = decrease
+        self.smoothing = smoothing
+
+    @classmethod
+    def from_config(cls, config) -> 'RefreshPolicy':
+        # CACHE_THRESHOLD_MINUTES was the former global interval, keep honouring it as the lower bound
+        min_minutes = config.get('REFRESH_MIN_MINUTES', config.get('CACHE_THRESHOLD_MINUTES', 5))
+        return cls(
+            min_interval=timedelta(minutes=min_minutes),
+            max_interval=timedelta(minutes=config.get('REFRESH_MAX_MINUTES', 24 * 60)),
+            jitter=config.get('REFRESH_JITTER', 0.1),
+        )
+
+    def is_due(self, state: SiteFetchState, now: datetime) -> bool:
+        return state is None or state.next_fetch_at is None or state.next_fetch_at <= now
+
+    def retry_at(self, state: SiteFetchState) -> datetime:
+        """
+        When the interval loop retries a site whose last attempt failed: the minimum interval
+        doubled per consecutive failure, up to the maximum interval.
+        """
+        failures = min(max(state.consecutive_failures or 1, 1), 32)
+        backoff = min(self.min_interval * 2 ** (failures - 1), self.max_interval)
+        return state.last_attempt_at + timedelta(seconds=backoff)
+
+    def record_success(self, state: SiteFetchState, changed: bool, now: datetime,
+                       started_at: Optional[datetime] = None) -> None:
+        """
+        Updates the site's change rate and interval after a successful fetch and schedules the next one.
+        last_success_at is when the fetch started (started_at, default now): fetchers compare job update
+        times against it, so changes made while the listing was being fetched and stored are not missed.
+        """
+        observed = 1.0 if changed else 0.0
+        if state.change_rate is None:
+            state.change_rate = observed
+        else:
+            state.change_rate = self.smoothing * observed + (1 - self.smoothing) * state.change_rate
+
+        interval = state.refresh_interval or self.min_interval
+        interval *= self.decrease if changed else self.increase
+        state.refresh_interval = min(max(interval, self.min_interval), self.max_interval)
+
+        spread = random.uniform(1 - self.jitter, 1 + self.jitter)
+        state.next_fetch_at = now + timedelta(seconds=state.refresh_interval * spread)
+        state.last_success_at = started_at or now
+        if changed:
+            state.last_changed_at = now
@@ -0,0 +1,84 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import click
+from flask import Flask
+from fetchers.archive import ResponseArchive
+from fetchers.http_session import enable_replay, replay_misses
+from fetchers.registry import FetcherSpec
+
+logger = logging.getLogger(__name__)
+
+
+def parse_archived(spec: FetcherSpec, archive_dir: str) -> Tuple[str, Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Runs a fetcher against the response archive instead of the network.
+    Executed in reparse worker processes, which import the fetcher; returns (site_name, jobs, error).
+    A request missing from the archive fails the site even when the fetcher caught the error:
+    its jobs would be incomplete, and storing them would close the ones that were not re-parsed.
+    """
+    enable_replay(ResponseArchive(archive_dir))
+    try:
+        jobs = spec.create().fetch_jobs()
+    except Exception as e:
+        return spec.site_name, None, str(e)
+    misses = replay_misses()
+    if misses:
+        return spec.site_name, None, (f"{len(misses)} request(s) not in the archive, first: {misses[0]}")
+    return spec.site_name, jobs, None
+
+
+def reparse_sites(app: Flask, site_names: Sequence[str] = (), workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Re-parses archived responses with the current fetcher code and re-stores the jobs.
+    Sites are parsed in a process pool; results are stored from this process,
+    one site at a time since SQLite allows a single writer.
+    Returns a summary of successful and failed sites, like FetcherManager.fetch_all_jobs.
+    """
+    from services.fetcher_manager import FetcherManager
+
+    archive_dir = app.config.get('RESPONSE_ARCHIVE_DIR', 'response_archive')
+    if not archive_dir or not os.path.isdir(archive_dir):
+        raise click.ClickException(f"No response archive found at {archive_dir!r}")
+
+    fetcher_manager = FetcherManager(app)
+    specs = [spec for spec in fetcher_manager.specs if not site_names or spec.site_name in site_names]
+    result = {"success": [], "failed": {}}
+    if not specs:
+        return result
+
+    # Re-parsing means the parsers changed: the next live fetch must parse unchanged listings too
+    fetcher_manager.clear_listing_fingerprints([spec.site_name for spec in specs])
+
+    workers = workers or min(len(specs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(parse_archived, spec, archive_dir) for spec in specs]
+        for future in as_completed(futures):
+            site_name, jobs, error = future.result()
+            if error is None:
+                try:
+                    fetcher_manager._store_jobs(site_name, jobs, record_state=False)
+                except Exception as e:
+                    error = str(e)
+            if error:
+                result["failed"][site_name] = error
+            else:
+                result["success"].append(site_name)
+
+    logger.info(f"Finished re-parsing archived responses. Success: {len(result['success'])}, "
+                f"Failed: {len(result['failed'])}")
+    return result
+
+
+def register_commands(app: Flask):
+    @app.cli.command('reparse')
+    @click.option('--site', 'site_names', multiple=True, help='Site name to re-parse (repeatable, default: all)')
+    @click.option('--workers', type=int, default=None, help='Parser processes (default: one per CPU)')
+    def reparse(site_names, workers):
+        """Re-parse archived responses with the current fetchers, without network access."""
+        result = reparse_sites(app, site_names, workers)
+        for site_name in result['success']:
+            click.echo(f"{site_name}: ok")
+        for site_name, error in result['failed'].items():
+            click.echo(f"{site_name}: failed - {error}", err=True)
@@ -0,0 +1,267 @@
+import itertools
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from flask import Flask
+from fetchers.politeness import configure_politeness
+from fetchers.registry import get_registry, select_specs
+from models import SiteFetchState
+from services.circuit_breaker import CircuitBreaker
+from services.refresh_policy import RefreshPolicy
+
+logger = logging.getLogger(__name__)
+
+# Full runs go through the bulk lane; selective runs through the priority lane, next to it
+LANES = ('bulk', 'priority')
+
+
+def next_due_at(state: SiteFetchState, refresh_policy: RefreshPolicy,
+                circuit_breaker: CircuitBreaker) -> Optional[datetime]:
+    """
+    When the interval loop should next run for a site: its next probe while its circuit is open,
+    a backoff after failed attempts (failed sites keep a past next_fetch_at), else its next_fetch_at.
+    """
+    if state.opened_at is not None:
+        return circuit_breaker.probe_at(state)
+    if state.last_error is not None and state.last_attempt_at is not None:
+        retry_at = refresh_policy.retry_at(state)
+        return max(retry_at, state.next_fetch_at) if state.next_fetch_at else retry_at
+    return state.next_fetch_at
+
+
+def run_selection(sites: Sequence[str] = (), tags: Sequence[str] = (), force: bool = False) -> Dict[str, Any]:
+    """Normalized sites/tags/force of a run, equal for triggers asking for the same work."""
+    return {'sites': sorted(set(sites)), 'tags': sorted({tag.lower() for tag in tags}), 'force': bool(force)}
+
+
+class FetchRun:
+    """
+    State of one fetch run. Every change is appended to an event log that
+    status requests and server-sent-event streams read from.
+    """
+
+    def __init__(self, run_id: int, trigger: str, lane: str = 'bulk', sites: Sequence[str] = (),
+                 tags: Sequence[str] = (), force: bool = False):
+        self.id = run_id
+        self.trigger = trigger
+        self.lane = lane
+        self.selection = run_selection(sites, tags, force)
+        self.status = 'pending'  # pending -> running -> finished | failed
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.sites: Dict[str, Dict[str, Any]] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self.events: List[Dict[str, Any]] = []
+        self._changed = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ('finished', 'failed')
+
+    def covers(self, lane: str, selection: Dict[str, Any]) -> bool:
+        """Whether a trigger for selection in lane can join this run: the same work, or a subset of a full run."""
+        if lane != self.lane:
+            return False
+        full_run = not self.selection['sites'] and not self.selection['tags']
+        return self.selection == selection or (full_run and self.selection['force'] >= selection['force'])
+
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        with self._changed:
+            self.events.append({'event': event, 'data': data})
+            self._changed.notify_all()
+
+    def start(self, site_names: List[str]) -> None:
+        self.status = 'running'
+        self.started_at = datetime.utcnow()
+        self.sites = {site_name: {'status': 'pending'} for site_name in site_names}
+        self._emit('run', self.summary())
+
+    def update_site(self, site_name: str, status: str, details: Dict[str, Any]) -> None:
+        # Called from fetch worker threads; the condition's lock is reentrant
+        with self._changed:
+            self.sites[site_name] = {'status': status, **details}
+            self._emit('site', {'site': site_name, **self.sites[site_name]})
+
+    def finish(self, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        self.result = result
+        self.error = error
+        self.status = 'failed' if error else 'finished'
+        self.finished_at = datetime.utcnow()
+        self._emit('run', self.summary())
+
+    def summary(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for site in self.sites.values():
+            counts[site['status']] = counts.get(site['status'], 0) + 1
+        return {
+            'id': self.id,
+            'trigger': self.trigger,
+            'lane': self.lane,
+            **self.selection,
+            'status': self.status,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'error': self.error,
+            'counts': counts,
+            # Sites skipped until their circuit breaker's next probe, known once the run finished
+            'circuit_open': sorted((self.result or {}).get('circuit_open', {})),
+            # Sites left to the other lane's run that was already fetching them
+            'running_elsewhere': (self.result or {}).get('running_elsewhere', []),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._changed:
+            return {**self.summary(), 'sites': dict(self.sites), 'result': self.result}
+
+    def stream(self, keepalive_seconds: float = 15) -> Iterator[str]:
+        """
+        Yields the run's events in server-sent-events format, starting from the first one,
+        until the run is done. Sends a comment line while idle so proxies keep the connection open.
+        """
+        position = 0
+        while True:
+            with self._changed:
+                if position >= len(self.events) and not self.done:
+                    self._changed.wait(timeout=keepalive_seconds)
+                pending = self.events[position:]
+                position += len(pending)
+                done = self.done
+
+            if not pending:
+                if done:
+                    return
+                yield ': keepalive\n\n'
+                continue
+            for event in pending:
+                yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+            if done and position >= len(self.events):
+                return
+
+
+class FetchScheduler:
+    """
+    Single-flight coordinator for fetch runs. At most one full run (bulk lane) is active
+    per process and triggers arriving while it runs coalesce into it. Runs restricted to
+    some sites or tags go through the priority lane alongside it, so a hot site is not
+    queued behind the full run; triggers asking for the same work coalesce, and a site
+    already being fetched by another run is skipped. Runs execute on a background
+    thread, started on demand through trigger() or automatically when
+    FETCH_INTERVAL_MINUTES is set: the loop wakes up when the earliest site in
+    site_fetch_state is due (open circuits at their probe, failed sites after a backoff),
+    waiting at least the refresh policy's minimum interval and at most FETCH_INTERVAL_MINUTES.
+    """
+
+    def __init__(self, app: Flask):
+        self.app = app
+        self.interval_minutes = app.config.get('FETCH_INTERVAL_MINUTES', 0)
+        self.history_size = app.config.get('FETCH_RUN_HISTORY', 20)
+        self.runs: 'OrderedDict[int, FetchRun]' = OrderedDict()
+        self.active_runs: List[FetchRun] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._interval_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts the interval loop when FETCH_INTERVAL_MINUTES is set."""
+        if not self.interval_minutes or self._interval_thread is not None:
+            return
+        self._interval_thread = threading.Thread(target=self._interval_loop, name='fetch-scheduler', daemon=True)
+        self._interval_thread.start()
+        logger.info(f"Fetch scheduler started, running at least every {self.interval_minutes} minutes")
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _seconds_until_due(self) -> float:
+        """Seconds until the earliest enabled site is due (see next_due_at), within the loop's bounds."""
+        longest = self.interval_minutes * 60
+        refresh_policy = RefreshPolicy.from_config(self.app.config)
+        circuit_breaker = CircuitBreaker.from_config(self.app.config)
+        # The floor keeps a site that is due again right away from triggering back-to-back runs
+        shortest = min(refresh_policy.min_interval, longest)
+        site_names = [spec.site_name for spec in get_registry().enabled()]
+        try:
+            with self.app.app_context():
+                states = SiteFetchState.query.filter(SiteFetchState.site_name.in_(site_names)).all()
+                due_times = [next_due_at(state, refresh_policy, circuit_breaker) for state in states]
+        except Exception as e:
+            logger.warning(f"Could not read the fetch schedule: {str(e)}")
+            return longest
+        due_times = [due_at for due_at in due_times if due_at is not None]
+        if not due_times:
+            return longest
+        return min(max((min(due_times) - datetime.utcnow()).total_seconds(), shortest), longest)
+
+    def _interval_loop(self) -> None:
+        while not self._stopped.wait(self._seconds_until_due()):
+            self.trigger('interval')
+
+    def trigger(self, reason: str = 'manual', sites: Sequence[str] = (), tags: Sequence[str] = (),
+                force: bool = False, lane: Optional[str] = None) -> FetchRun:
+        """
+        Starts a run of the given sites/tags (all sites when neither is given, see FetcherManager.select),
+        or returns the active run it coalesces into. lane defaults to 'priority' for selective runs.
+        Returns immediately, the run continues on a background thread.
+        Raises ValueError for unknown sites, tags or lanes.
+        """
+        lane = lane or ('priority' if sites or tags else 'bulk')
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane {lane!r} (available: {', '.join(LANES)})")
+        select_specs(get_registry().enabled(), sites, tags)
+        with self._lock:
+            selection = run_selection(sites, tags, force)
+            for active in self.active_runs:
+                if active.covers(lane, selection):
+                    logger.info(f"Fetch {reason} trigger coalesced into run {active.id}")
+                    return active
+
+            run = FetchRun(next(self._ids), reason, lane, sites, tags, force)
+            self.active_runs.append(run)
+            self.runs[run.id] = run
+            while len(self.runs) > self.history_size:
+                self.runs.popitem(last=False)
+
+        threading.Thread(target=self._execute, args=(run,), name=f'fetch-run-{run.id}', daemon=True).start()
+        return run
+
+    def _execute(self, run: FetchRun) -> None:
+        from services.fetcher_manager import FetcherManager
+
+        try:
+            fetcher_manager = FetcherManager(self.app)
+            fetcher_manager.on_progress = run.update_site
+            sites, tags, force = run.selection['sites'], run.selection['tags'], run.selection['force']
+            run.start([spec.site_name for spec in fetcher_manager.select(sites, tags)])
+            run.finish(result=fetcher_manager.fetch_all_jobs(sites, tags, force))
+        except Exception as e:
+            logger.error(f"Fetch run {run.id} failed: {str(e)}", exc_info=True)
+            run.finish(error=str(e))
+        finally:
+            with self._lock:
+                self.active_runs.remove(run)
+
+    def get_run(self, run_id: int) -> Optional[FetchRun]:
+        return self.runs.get(run_id)
+
+    @property
+    def latest_run(self) -> Optional[FetchRun]:
+        return next(reversed(self.runs.values()), None)
+
+
+def init_scheduler(app: Flask) -> FetchScheduler:
+    """Creates the app's fetch scheduler and starts its interval loop if configured."""
+    # Host limiters outlive runs: overlapping runs must see each other's pauses and in-flight requests
+    configure_politeness(app.config)
+    scheduler = FetchScheduler(app)
+    app.extensions['fetch_scheduler'] = scheduler
+    scheduler.start()
+    return scheduler
+
+
+def get_scheduler(app: Flask) -> FetchScheduler:
+    return app.extensions['fetch_scheduler']
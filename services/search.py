@@ -0,0 +1,104 @@
+import logging
+import re
+from typing import Optional, Tuple
+from sqlalchemy import column, select, table, text
+from sqlalchemy.exc import OperationalError
+from models import Job, db
+
+logger = logging.getLogger(__name__)
+
+# External-content FTS5 index over job title/description, kept in sync by triggers
+# so every write path (ORM, Core bulk statements, deletes) updates it.
+FTS_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS job_fts USING fts5(
+        title, description,
+        content='job', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS job_fts_ai AFTER INSERT ON job BEGIN
+        INSERT INTO job_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS job_fts_ad AFTER DELETE ON job BEGIN
+        INSERT INTO job_fts(job_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS job_fts_au AFTER UPDATE OF title, description ON job BEGIN
+        INSERT INTO job_fts(job_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO job_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+# Lightweight handle for querying the virtual table; it is not part of db.metadata
+job_fts = table('job_fts', column('rowid'), column('rank'), column('job_fts'))
+
+_fts_available = False
+
+
+def ensure_search_index() -> bool:
+    """
+    Creates the FTS5 table and triggers if needed and indexes existing jobs when the
+    table is new. Returns False (search falls back to LIKE) when SQLite lacks FTS5.
+    """
+    global _fts_available
+    if db.engine.dialect.name != 'sqlite':
+        return False
+
+    try:
+        with db.engine.begin() as conn:
+            exists = conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_fts'")).first()
+            for statement in FTS_SCHEMA:
+                conn.execute(text(statement))
+            if not exists:
+                conn.execute(text("INSERT INTO job_fts(job_fts) VALUES ('rebuild')"))
+                logger.info("Built full-text index for existing jobs")
+        _fts_available = True
+    except OperationalError as e:
+        logger.warning(f"Full-text search unavailable, falling back to LIKE: {str(e)}")
+        _fts_available = False
+    return _fts_available
+
+
+def build_match_query(search_term: str) -> str:
+    """
+    Translates user input into an FTS5 query. Quoted text is a phrase query,
+    a trailing * makes a prefix query and OR/NOT are kept as operators when they
+    have a term on both sides; otherwise they are searched as words, so a leading
+    'NOT rust' cannot turn into 'rust'. Every other word is quoted so FTS syntax
+    characters cannot break the query. Terms are ANDed together.
+    """
+    tokens = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', search_term):
+        if phrase.strip():
+            tokens.append('"' + phrase.strip().replace('"', '') + '"')
+        elif word in ('OR', 'NOT'):
+            tokens.append(word)
+        elif word:
+            prefix = word.endswith('*')
+            word = re.sub(r'[^\w]+', ' ', word).strip()
+            if word:
+                tokens.append(f'"{word}"' + ('*' if prefix else ''))
+
+    parts = []
+    for i, token in enumerate(tokens):
+        if token in ('OR', 'NOT'):
+            # An operator right after another one has no left-hand term and becomes a word itself
+            has_left = bool(parts) and parts[-1] not in ('OR', 'NOT')
+            if not (has_left and i + 1 < len(tokens)):
+                token = f'"{token}"'
+        parts.append(token)
+    return ' '.join(parts)
+
+
+def apply_search(query, search_term: str) -> Tuple[object, Optional[object]]:
+    """
+    Restricts a Job query to rows matching search_term.
+    Returns the filtered query and the relevance column to order by (lower is better),
+    or None when the LIKE fallback is used.
+    """
+    match = build_match_query(search_term) if _fts_available else ''
+    if not match:
+        return query.filter(Job.title.contains(search_term) | Job.description.contains(search_term)), None
+
+    hits = select(job_fts.c.rowid, job_fts.c.rank)\
+        .where(job_fts.c.job_fts.op('MATCH')(match))\
+        .subquery()
+    return query.join(hits, Job.id == hits.c.rowid), hits.c.rank
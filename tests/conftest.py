@@ -0,0 +1,28 @@
+import pytest
+
+
+@pytest.fixture
+def app(tmp_path):
+    """A Flask app with the routes and an empty SQLite database in tmp_path."""
+    pytest.importorskip('flask_sqlalchemy')
+    pytest.importorskip('aiohttp')
+    pytest.importorskip('bs4')
+    from flask import Flask
+    from extensions import db
+    from models import upgrade_schema
+    from routes import register_routes
+
+    app = Flask(__name__, root_path=str(tmp_path))
+    app.config.update(
+        SECRET_KEY='test',
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'jobs.db'}",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        RESPONSE_ARCHIVE_DIR=str(tmp_path / 'response_archive'),
+        PARSE_WORKERS=0,
+    )
+    db.init_app(app)
+    with app.app_context():
+        register_routes(app)
+        db.create_all()
+        upgrade_schema()
+    return app
@@ -0,0 +1,104 @@
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip('flask_sqlalchemy')
+pytest.importorskip('requests')
+pytest.importorskip('aiohttp')
+pytest.importorskip('bs4')
+
+from fetchers.base_fetcher import BaseFetcher  # noqa: E402
+from fetchers.registry import FetcherSpec  # noqa: E402
+
+LISTING = '<ul><li><a href="/jobs/1">Quant Researcher</a></li><li><a href="/jobs/2">Trader</a></li></ul>'
+
+
+class StaticFetcher(BaseFetcher):
+    """Serves the same listing on every run."""
+
+    def __init__(self):
+        super().__init__(site_name='Static Site', url='https://example.com/careers')
+
+    async def _get_html_async(self, session) -> str:
+        return LISTING
+
+    def parse_jobs(self, html: str) -> List[Dict[str, Any]]:
+        return [
+            {'title': 'Quant Researcher', 'description': '', 'url': 'https://example.com/jobs/1', 'location': ''},
+            {'title': 'Trader', 'description': '', 'url': 'https://example.com/jobs/2', 'location': ''},
+        ]
+
+
+def make_manager(app):
+    from services.fetcher_manager import FetcherManager
+
+    manager = FetcherManager(app)
+    manager.specs = [FetcherSpec(site_name='Static Site', module=__name__, class_name='StaticFetcher')]
+    return manager
+
+
+def open_job_count(app) -> int:
+    from models import Job
+
+    with app.app_context():
+        return Job.query.filter(Job.closed_at.is_(None)).count()
+
+
+def test_forced_fetch_after_delete_stores_the_unchanged_listing(app):
+    manager = make_manager(app)
+    assert manager.fetch_all_jobs()['success'] == ['Static Site']
+    assert open_job_count(app) == 2
+
+    response = app.test_client().post('/delete-jobs')
+    assert response.status_code == 302
+    assert open_job_count(app) == 0
+
+    result = manager.fetch_all_jobs(sites=['Static Site'], force=True)
+    assert result['success'] == ['Static Site']
+    assert open_job_count(app) == 2
+
+
+def test_forced_fetch_parses_an_unchanged_listing(app):
+    from models import Job, db
+
+    manager = make_manager(app)
+    manager.fetch_all_jobs()
+    with app.app_context():
+        Job.query.delete()
+        db.session.commit()
+
+    # Jobs gone without the fingerprint being reset: force still parses and stores them
+    manager.fetch_all_jobs(sites=['Static Site'], force=True)
+    assert open_job_count(app) == 2
+
+
+def test_jobs_stored_by_url_are_matched_when_the_fetcher_adds_job_ids(app):
+    from datetime import datetime
+    from models import Job, db
+
+    first_seen = datetime(2025, 6, 1)
+    with app.app_context():
+        db.session.add(Job(job_key='https://example.com/jobs/1', title='Quant Researcher', description='',
+                           source_site='Static Site', url='https://example.com/jobs/1', location='',
+                           first_seen=first_seen))
+        db.session.commit()
+
+    job = {'job_id': '1', 'title': 'Quant Researcher', 'description': '', 'url': 'https://example.com/jobs/1',
+           'location': ''}
+    stats = make_manager(app)._store_jobs('Static Site', [job])
+    assert stats['inserted'] == 0 and stats['closed'] == 0
+    with app.app_context():
+        rows = Job.query.all()
+    assert [(row.job_key, row.first_seen, row.closed_at) for row in rows] == [('1', first_seen, None)]
+
+
+def test_last_success_is_the_start_of_the_fetch(app):
+    from datetime import datetime
+    from models import SiteFetchState, db
+
+    before = datetime.utcnow()
+    make_manager(app).fetch_all_jobs()
+    with app.app_context():
+        state = db.session.get(SiteFetchState, 'Static Site')
+    # Postings updated while the listing was fetched and stored are newer than the watermark
+    assert before <= state.last_success_at == state.last_attempt_at
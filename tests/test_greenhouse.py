@@ -0,0 +1,63 @@
+import json
+from datetime import datetime
+
+import pytest
+
+requests = pytest.importorskip('requests')
+pytest.importorskip('aiohttp')
+pytest.importorskip('bs4')
+
+from fetchers.greenhouse import GreenhouseFetcher  # noqa: E402
+
+LISTING = {'jobs': [{'id': 1, 'title': 'Quant Developer', 'updated_at': '2026-01-05T10:00:00Z',
+                     'absolute_url': 'https://example.com/jobs/1', 'location': {'name': 'London'}}]}
+DETAIL = {'id': 1, 'content': '&lt;p&gt;Build trading systems&lt;/p&gt;', 'departments': []}
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.text = json.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeBoardsApi:
+    """Serves one board; the job content request fails while content_down is set."""
+
+    def __init__(self):
+        self.content_down = False
+
+    def get(self, url, headers=None, timeout=None):
+        if url.endswith('/jobs'):
+            return FakeResponse(LISTING)
+        if self.content_down:
+            raise requests.ConnectionError('connection reset')
+        return FakeResponse(DETAIL)
+
+
+def make_fetcher(api, previous_fingerprint):
+    fetcher = GreenhouseFetcher('Test Board', ['test'])
+    fetcher.session = api
+    fetcher.previous_listing_fingerprint = previous_fingerprint
+    fetcher.last_success_at = datetime(2026, 1, 6)
+    return fetcher
+
+
+def test_failed_content_is_retried_on_the_next_run():
+    api = FakeBoardsApi()
+    api.content_down = True
+    first = make_fetcher(api, None)
+    jobs = first.fetch_jobs()
+    assert jobs[0]['description'] == ''
+    assert first.listing_fingerprint is None
+
+    # The listing is unchanged, but the missing content must not be skipped as ListingUnchanged
+    api.content_down = False
+    second = make_fetcher(api, first.listing_fingerprint)
+    jobs = second.fetch_jobs()
+    assert jobs[0]['description'] == 'Build trading systems'
+    assert second.listing_fingerprint is not None
@@ -0,0 +1,51 @@
+import io
+import json
+
+import pytest
+
+requests = pytest.importorskip('requests')
+pytest.importorskip('aiohttp')
+pytest.importorskip('bs4')
+
+from requests.adapters import HTTPAdapter  # noqa: E402
+from urllib3 import HTTPResponse  # noqa: E402
+from fetchers import http_session  # noqa: E402
+from fetchers.archive import ResponseArchive  # noqa: E402
+from fetchers.brevanhoward_fetcher import BrevanHowardFetcher  # noqa: E402
+from fetchers.registry import FetcherSpec  # noqa: E402
+from fetchers.workday import WorkdayFetcher  # noqa: E402
+from services.reparse import parse_archived  # noqa: E402
+
+POSTINGS = {'total': 1, 'jobPostings': [{'title': 'Quant Analyst', 'externalPath': '/job/London/Quant-Analyst_R1',
+                                         'locationsText': 'London', 'postedOn': 'Posted Today',
+                                         'bulletFields': ['R1']}]}
+
+
+def archive_live_response(archive, method, url, body, payload, set_cookies=()):
+    """Archives a response the way the live response hook does, built from raw urllib3 headers."""
+    request = requests.Request(method, url, json=body).prepare()
+    raw = HTTPResponse(body=io.BytesIO(payload), status=200, preload_content=False,
+                       headers=[('Content-Type', 'application/json'), *(('Set-Cookie', c) for c in set_cookies)])
+    archive.record_response(HTTPAdapter().build_response(request, raw))
+
+
+def test_reparse_workday_site_replays_csrf_cookie(tmp_path, monkeypatch):
+    # enable_replay changes module state, restore it for the other tests
+    for name in ('_replay_archive', '_replay_misses', '_session'):
+        monkeypatch.setattr(http_session, name, getattr(http_session, name))
+    monkeypatch.setattr(WorkdayFetcher, '_csrf_sessions', {})
+
+    fetcher = BrevanHowardFetcher()
+    archive = ResponseArchive(str(tmp_path))
+    archive_live_response(archive, 'GET', fetcher.careers_url, None, b'<html></html>', [
+        'PLAY_SESSION=abc; Path=/; Secure; HttpOnly',
+        'CALYPSO_CSRF_TOKEN=token-1; Path=/; Expires=Thu, 01 Jan 2026 00:00:00 GMT; Secure',
+    ])
+    page = {'appliedFacets': {}, 'limit': fetcher.page_size, 'offset': 0, 'searchText': ''}
+    archive_live_response(archive, 'POST', fetcher.url, page, json.dumps(POSTINGS).encode())
+
+    spec = FetcherSpec(site_name='Brevan Howard', module='fetchers.brevanhoward_fetcher',
+                       class_name='BrevanHowardFetcher', ats='workday', cost='paged')
+    site_name, jobs, error = parse_archived(spec, str(tmp_path))
+    assert error is None
+    assert [job['title'] for job in jobs] == ['Quant Analyst']
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def scheduler(app):
+    from services.scheduler import FetchScheduler
+
+    app.config.update(FETCH_INTERVAL_MINUTES=24 * 60, REFRESH_MIN_MINUTES=5, CIRCUIT_COOLDOWN_MINUTES=60)
+    return FetchScheduler(app)
+
+
+def add_state(app, **columns):
+    from fetchers.registry import get_registry
+    from models import SiteFetchState, db
+
+    with app.app_context():
+        db.session.add(SiteFetchState(site_name=get_registry().enabled()[0].site_name, **columns))
+        db.session.commit()
+
+
+def test_open_circuit_wakes_up_at_its_probe(app, scheduler):
+    now = datetime.utcnow()
+    add_state(app, next_fetch_at=now - timedelta(hours=2), last_attempt_at=now - timedelta(minutes=30),
+              last_error='timeout', consecutive_failures=5, opened_at=now - timedelta(minutes=30))
+    assert scheduler._seconds_until_due() == pytest.approx(30 * 60, abs=5)
+
+
+def test_failed_site_wakes_up_after_a_backoff(app, scheduler):
+    now = datetime.utcnow()
+    add_state(app, next_fetch_at=now - timedelta(hours=2), last_attempt_at=now,
+              last_error='timeout', consecutive_failures=3)
+    # 5 minutes doubled for the second and third failure
+    assert scheduler._seconds_until_due() == pytest.approx(20 * 60, abs=5)
+
+
+def test_due_site_wakes_up_after_the_minimum_interval(app, scheduler):
+    add_state(app, next_fetch_at=datetime.utcnow() - timedelta(hours=2))
+    assert scheduler._seconds_until_due() == 5 * 60